@@ -3,22 +3,50 @@ Meshing-Around Web GUI - FastAPI Backend
 Configuration management API for MeshBOT
 """
 
+import io
 import os
+import errno
+import stat
 import re
 import json
+import mmap
 import gzip
+import bisect
+import heapq
 import shutil
+import itertools
+import filecmp
 import asyncio
-import subprocess
+import functools
+import threading
+import time
+import httpx
+import orjson
+
+try:
+    # ISA-L backed gzip compresses and decompresses archives several times
+    # faster; the stdlib module is the fallback. igzip only has levels 0-3,
+    # and its 3 is still faster than zlib at 6 for a similar ratio.
+    from isal import igzip as fast_gzip
+    ARCHIVE_COMPRESSLEVEL = 3
+except ImportError:
+    fast_gzip = gzip
+    ARCHIVE_COMPRESSLEVEL = 6
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi import FastAPI, HTTPException, Depends, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.security import APIKeyHeader
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import RedirectResponse
@@ -47,7 +75,71 @@ LEADERBOARD_EXPORT_PATH = os.environ.get("LEADERBOARD_EXPORT_PATH", "/app/data/l
 NODEDB_PATH = os.environ.get("NODEDB_PATH", "/app/data/nodedb.json")
 MAX_LOG_ENTRIES = 100  # Keep last 100 log entries
 LOG_ARCHIVE_INTERVAL = 3600  # Archive logs every hour
+LOG_FLUSH_INTERVAL = 2  # Flush scheduler log to disk every 2 seconds when dirty
+BBS_PEERS_FLUSH_INTERVAL = 10  # Flush BBS peers to disk every 10 seconds when dirty
 LOG_RETENTION_DAYS = 30  # Keep archives for 30 days
+TAIL_BLOCK_SIZE = 64 * 1024  # Block size when reading log files backwards
+BACKUP_MIN_INTERVAL = 30  # Reuse a backup younger than this (seconds) if the config is unchanged
+
+# Meshbot log patterns (compiled once, used on every log view request)
+# _CHANNEL_SEND_RE and _ERROR_RE are MULTILINE and run over a whole block of
+# stripped lines joined with '\n'; [^\S\n] is whitespace that stays on one line.
+# Channel send: 2025-11-28 14:38:41,970 |     INFO | Device:1 Channel:2 SendingChannel: bbslink MeshBot looking for peers
+_CHANNEL_SEND_RE = re.compile(
+    r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*Device:(\d+) Channel:(\d+) SendingChannel: (.+)$',
+    re.MULTILINE
+)
+# Send errors, one alternative per pattern; the lazy prefixes make earlier
+# alternatives win over later ones, same as searching each pattern in turn
+_ERROR_RE = re.compile(
+    r'^(?:.*?Exception during send_message:[^\S\n]*(.+)'
+    r'|.*?Error Opening interface\d+ on:[^\S\n]*(.+)'
+    r'|.*?Error.*send.*?:[^\S\n]*(.+)'
+    r'|.*?failed to send.*?:[^\S\n]*(.+)'
+    r'|.*?\|[^\S\n]*ERROR[^\S\n]*\|[^\S\n]*(.+))',
+    re.IGNORECASE | re.MULTILINE
+)
+# Log line: 2025-11-28 17:02:55,911 |    DEBUG | System: Message here
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+_LOG_RE_TEMPLATE = r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|\s*(%s)\s*\|\s*(.+)$'
+_LOG_RE = re.compile(_LOG_RE_TEMPLATE % '|'.join(_LOG_LEVELS))
+# _LOG_RE narrowed to one level, so a level filter rejects other lines inside the regex
+_LOG_RE_BY_LEVEL = {lvl: re.compile(_LOG_RE_TEMPLATE % lvl) for lvl in _LOG_LEVELS}
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# BBS link events, tried in order as one alternation; the outer named group
+# identifies which event matched
+_BBS_TS = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*'
+_BBS_EVENT_PATTERNS = (
+    # Channel broadcast sent
+    ('broadcast_sent', r'(?i:' + _BBS_TS + r'Device:(\d+) Channel:(\d+) SendingChannel: (bbslink.*))$',
+     (('device', int), ('channel', int), ('message', None))),
+    # Channel message received with node name
+    ('broadcast_received', r'(?i:' + _BBS_TS + r'Device:(\d+) Channel:(\d+) ReceivedChannel: (bbslink.*) From: (.+))$',
+     (('device', int), ('channel', int), ('message', None), ('node_name', None))),
+    # DM sent with node name
+    ('dm_sent', r'(?i:' + _BBS_TS + r'Device:(\d+) Sending DM: (bbslink.*|bbsack.*) To: (.+))$',
+     (('device', int), ('message', None), ('node_name', None))),
+    # DM received with node name
+    ('dm_received', r'(?i:' + _BBS_TS + r'Device:(\d+) Channel: (\d+) Received DM: (bbslink.*|bbsack.*) From: (.+))$',
+     (('device', int), ('channel', int), ('message', None), ('node_name', None))),
+    # Debug: wait to sync
+    ('wait_sync', _BBS_TS + r'System: wait to bbslink with peer (\d+)$',
+     (('node_id', int),)),
+    # Debug: sending message
+    ('sending_sync', _BBS_TS + r'System: Sending bbslink message (\d+) of (\d+) to peer (\d+)$',
+     (('message_num', int), ('total_messages', int), ('node_id', int))),
+    # Debug: sync complete
+    ('sync_complete', _BBS_TS + r'System: bbslink sync complete with peer (\d+)$',
+     (('node_id', int),)),
+)
+_BBS_EVENT_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern, _ in _BBS_EVENT_PATTERNS))
+# Every BBS event line contains bbslink/bbsack; used to find candidate lines in raw log bytes
+_BBS_HINT_RE = re.compile(rb'(?i)bbs')
+# event type -> (index of its timestamp in match.groups(), (field, converter) pairs)
+_BBS_EVENT_FIELDS = {
+    name: (_BBS_EVENT_RE.groupindex[name], fields) for name, _, fields in _BBS_EVENT_PATTERNS
+}
 
 # Authentication
 # Set WEBGUI_API_KEY env var to enable API key auth
@@ -93,16 +185,28 @@ async def verify_auth(request: Request, api_key: str = Depends(api_key_header)):
 # Lifespan handler for background tasks
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global archive_task, session_cleanup_task
+    global archive_task, session_cleanup_task, log_flush_task, bbs_peers_flush_task
     ensure_archive_dir_startup()
     ensure_data_files_startup()
     archive_task = asyncio.create_task(periodic_archive_task())
     session_cleanup_task = asyncio.create_task(periodic_session_cleanup())
+    log_flush_task = asyncio.create_task(periodic_log_flush())
+    bbs_peers_flush_task = asyncio.create_task(periodic_bbs_peers_flush())
     yield
     if archive_task:
         archive_task.cancel()
     if session_cleanup_task:
         session_cleanup_task.cancel()
+    if log_flush_task:
+        log_flush_task.cancel()
+    if bbs_peers_flush_task:
+        bbs_peers_flush_task.cancel()
+    if config_writer_task:
+        config_writer_task.cancel()
+    flush_scheduler_log()
+    flush_bbs_peers()
+    if _docker_client is not None:
+        await _docker_client.aclose()
 
 def ensure_archive_dir_startup():
     """Create archive directory on startup."""
@@ -124,19 +228,55 @@ def ensure_data_files_startup():
         shutil.copy2(str(old_log), str(SCHEDULER_LOG_PATH))
         print(f"Migrated scheduler_log.json to {SCHEDULER_LOG_PATH}")
 
+    # Load scheduler log into memory once; appends are flushed in the background
+    with _log_lock:
+        _clear_log_columns()
+        for entry in read_scheduler_log_file():
+            _append_log_row(entry)
+
 async def periodic_archive_task():
     """Background task to archive logs periodically."""
+    # Ticks are scheduled against a monotonic deadline so the time spent
+    # archiving doesn't push every later run back
+    next_tick = time.monotonic() + LOG_ARCHIVE_INTERVAL
     while True:
-        await asyncio.sleep(LOG_ARCHIVE_INTERVAL)
+        await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
         try:
-            archive_current_log()
-            cleanup_old_archives()
+            await run_log_task(archive_current_log)
+            await run_log_task(cleanup_old_archives)
             print(f"Log archived at {datetime.now()}")
         except Exception as e:
             print(f"Archive task error: {e}")
+        next_tick += LOG_ARCHIVE_INTERVAL
+        # After a stall (e.g. host suspend) skip the missed ticks rather than
+        # archiving back to back
+        now = time.monotonic()
+        if next_tick <= now:
+            next_tick += ((now - next_tick) // LOG_ARCHIVE_INTERVAL + 1) * LOG_ARCHIVE_INTERVAL
 
 archive_task = None
 session_cleanup_task = None
+log_flush_task = None
+bbs_peers_flush_task = None
+
+# The flushes write files, so they run in a worker thread rather than on the event loop
+async def periodic_log_flush():
+    """Background task to persist the in-memory scheduler log when it changes."""
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(flush_scheduler_log)
+        except Exception as e:
+            print(f"Scheduler log flush error: {e}")
+
+async def periodic_bbs_peers_flush():
+    """Background task to persist the in-memory BBS peers data when it changes."""
+    while True:
+        await asyncio.sleep(BBS_PEERS_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(flush_bbs_peers)
+        except Exception as e:
+            print(f"BBS peers flush error: {e}")
 
 async def periodic_session_cleanup():
     """Periodically clean up expired OIDC sessions."""
@@ -155,6 +295,7 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
     dependencies=[Depends(verify_auth)],
+    default_response_class=ORJSONResponse,
 )
 
 # CORS - restrict to same-origin by default
@@ -173,6 +314,9 @@ if CORS_ORIGINS:
 # Session middleware (required by authlib for OAuth state)
 app.add_middleware(SessionMiddleware, secret_key=OIDC_SESSION_SECRET)
 
+# Compress larger responses (node lists, logs, archives) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Mount static files
 static_path = Path(__file__).parent / "static"
 if static_path.exists():
@@ -230,14 +374,41 @@ class SchedulerLogEntry(BaseModel):
 class ConfigParser:
     """Custom config parser that preserves comments and formatting"""
 
+    # Parsed files keyed by path: (mtime_ns, size, inode, lines, sections, comments)
+    _cache: Dict[str, tuple] = {}
+
     def __init__(self, path: str):
         self.path = path
         self.lines: List[str] = []
         self.sections: Dict[str, Dict[str, str]] = {}
         self.comments: Dict[str, Dict[str, str]] = {}
 
-    def read(self) -> Dict[str, Dict[str, str]]:
-        """Read config file preserving structure"""
+    def read(self, copy: bool = True) -> Dict[str, Dict[str, str]]:
+        """Read config file preserving structure.
+
+        With copy=False a cache hit shares the cached structures instead of
+        copying them; only use that when the parser will not be modified.
+        """
+        st = os.stat(self.path)
+        cache_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = ConfigParser._cache.get(self.path)
+        if cached and cached[:3] == cache_key:
+            if not copy:
+                self.lines, self.sections, self.comments = cached[3:]
+                return self.sections
+            # Callers mutate sections/lines before write(), so hand out copies
+            self.lines = list(cached[3])
+            self.sections = {name: dict(values) for name, values in cached[4].items()}
+            self.comments = {name: dict(values) for name, values in cached[5].items()}
+            return self.sections
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self._parse(f)
+        self._store_cache(cache_key)
+        return self.sections
+
+    def _parse(self, lines) -> None:
+        """Replace lines/sections/comments with the parse of an iterable of lines"""
         self.lines = []
         self.sections = {}
         self.comments = {}
@@ -245,32 +416,43 @@ class ConfigParser:
         current_section = None
         current_comment = []
 
-        with open(self.path, 'r', encoding='utf-8') as f:
-            for line in f:
-                self.lines.append(line)
-                stripped = line.strip()
+        for line in lines:
+            self.lines.append(line)
+            stripped = line.strip()
 
-                if stripped.startswith('#') or stripped == '':
-                    current_comment.append(line)
-                    continue
+            if stripped.startswith('#') or stripped == '':
+                current_comment.append(line)
+                continue
 
-                if stripped.startswith('[') and stripped.endswith(']'):
-                    current_section = stripped[1:-1]
-                    self.sections[current_section] = {}
-                    self.comments[current_section] = {}
-                    current_comment = []
-                    continue
+            if stripped.startswith('[') and stripped.endswith(']'):
+                current_section = stripped[1:-1]
+                self.sections[current_section] = {}
+                self.comments[current_section] = {}
+                current_comment = []
+                continue
 
-                if current_section and '=' in stripped:
-                    key, value = stripped.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    self.sections[current_section][key] = value
-                    if current_comment:
-                        self.comments[current_section][key] = ''.join(current_comment)
-                    current_comment = []
+            if current_section and '=' in stripped:
+                key, value = stripped.split('=', 1)
+                key = key.strip()
+                value = value.strip()
+                self.sections[current_section][key] = value
+                if current_comment:
+                    self.comments[current_section][key] = ''.join(current_comment)
+                current_comment = []
+
+    def _store_cache(self, cache_key: tuple) -> None:
+        ConfigParser._cache[self.path] = cache_key + (
+            list(self.lines),
+            {name: dict(values) for name, values in self.sections.items()},
+            {name: dict(values) for name, values in self.comments.items()},
+        )
 
-        return self.sections
+    @classmethod
+    def shared(cls, path: str) -> 'ConfigParser':
+        """Read-only parser for path, served from the parse cache without copying"""
+        parser = cls(path)
+        parser.read(copy=False)
+        return parser
 
     def get(self, section: str, key: str, default: str = '') -> str:
         return self.sections.get(section, {}).get(key, default)
@@ -288,6 +470,10 @@ class ConfigParser:
 
         self.sections[section][key] = value
 
+    def update(self, section: str, values: Dict[str, str]) -> None:
+        """Set several already-formatted string values in a section at once"""
+        self.sections.setdefault(section, {}).update(values)
+
     def add_section(self, section: str) -> None:
         if section not in self.sections:
             self.sections[section] = {}
@@ -317,58 +503,149 @@ class ConfigParser:
         return True
 
     def write(self) -> None:
-        new_lines = []
+        buf = io.StringIO()
         current_section = None
-        written_keys = set()
+        current_values = None  # self.sections entry for current_section, if any
+        written_keys = {}  # section -> set of keys already written
+        current_written = None  # written_keys entry for current_section
         written_sections = set()
 
         for line in self.lines:
             stripped = line.strip()
 
             if stripped.startswith('#') or stripped == '':
-                new_lines.append(line)
+                buf.write(line)
                 continue
 
             if stripped.startswith('[') and stripped.endswith(']'):
-                if current_section and current_section in self.sections:
-                    section_written = written_keys.copy()
-                    for key, value in self.sections[current_section].items():
-                        if f"{current_section}.{key}" not in section_written:
-                            new_lines.append(f"{key} = {value}\n")
-                            written_keys.add(f"{current_section}.{key}")
+                if current_values is not None:
+                    for key, value in current_values.items():
+                        if key not in current_written:
+                            buf.write(f"{key} = {value}\n")
+                            current_written.add(key)
 
                 current_section = stripped[1:-1]
+                current_values = self.sections.get(current_section) if current_section else None
+                current_written = written_keys.setdefault(current_section, set())
                 written_sections.add(current_section)
-                new_lines.append(line)
+                buf.write(line)
                 continue
 
             if current_section and '=' in stripped:
                 key = stripped.split('=', 1)[0].strip()
-                if current_section in self.sections and key in self.sections[current_section]:
-                    value = self.sections[current_section][key]
+                if current_values is not None and key in current_values:
+                    value = current_values[key]
                     indent = len(line) - len(line.lstrip())
-                    new_lines.append(' ' * indent + f"{key} = {value}\n")
-                    written_keys.add(f"{current_section}.{key}")
+                    buf.write(f"{' ' * indent}{key} = {value}\n")
+                    current_written.add(key)
                 else:
-                    new_lines.append(line)
+                    buf.write(line)
                 continue
 
-            new_lines.append(line)
+            buf.write(line)
 
-        if current_section and current_section in self.sections:
-            for key, value in self.sections[current_section].items():
-                if f"{current_section}.{key}" not in written_keys:
-                    new_lines.append(f"{key} = {value}\n")
-                    written_keys.add(f"{current_section}.{key}")
+        if current_values is not None:
+            for key, value in current_values.items():
+                if key not in current_written:
+                    buf.write(f"{key} = {value}\n")
 
         for section, keys in self.sections.items():
             if section not in written_sections:
-                new_lines.append(f"\n[{section}]\n")
+                buf.write(f"\n[{section}]\n")
                 for key, value in keys.items():
-                    new_lines.append(f"{key} = {value}\n")
+                    buf.write(f"{key} = {value}\n")
+
+        text = buf.getvalue()
+        data = text.encode('utf-8')
+        ConfigParser._cache.pop(self.path, None)
+        try:
+            atomic_write_bytes(self.path, data, fsync=True)
+        except OSError as e:
+            # config.ini is usually a single-file bind mount (see compose.yaml),
+            # which can't be renamed over - fall back to rewriting it in place
+            if e.errno not in (errno.EBUSY, errno.EXDEV):
+                raise
+            with open(self.path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+        # Seed the parse cache from the text just written, so the read that
+        # follows a save doesn't go back to disk for it
+        st = os.stat(self.path)
+        written = ConfigParser(self.path)
+        written._parse(io.StringIO(text, newline=None))
+        written._store_cache((st.st_mtime_ns, st.st_size, st.st_ino))
+
+
+def atomic_write_bytes(path, data: bytes, fsync: bool = False) -> None:
+    """
+    Write data to a temp file and os.replace() it over path, so readers never see a partial file.
+    With fsync=True the data and the rename are flushed to disk before returning.
+    """
+    temp_path = f"{path}.tmp"
+    try:
+        target_st = os.stat(path)
+    except FileNotFoundError:
+        target_st = None
+    try:
+        # The payload is already one bytes object, so write it straight to
+        # the fd instead of through a buffered file object. A replacement for
+        # an existing file starts private (config.ini holds credentials).
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o600 if target_st is not None else 0o666)
+        try:
+            if target_st is not None:
+                # The rename swaps in a new inode, so carry the target's
+                # owner and mode over to it; chown needs privileges the web
+                # GUI may not have, in which case it keeps its own uid
+                try:
+                    os.fchown(fd, target_st.st_uid, target_st.st_gid)
+                except PermissionError:
+                    pass
+                os.fchmod(fd, stat.S_IMODE(target_st.st_mode))
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if fsync:
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
-        with open(self.path, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
+
+def loads_json(raw: bytes) -> Any:
+    """Decode JSON with orjson, falling back to the stdlib for the NaN/Infinity literals json.dump() can emit."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+def loads_json_mapped(f) -> Any:
+    """
+    Decode a JSON file like loads_json, but through mmap so orjson parses the
+    page cache directly instead of a bytes copy of the whole file. Only safe
+    for files that are replaced atomically rather than truncated in place.
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(mm[:])
 
 
 def create_backup() -> str:
@@ -379,34 +656,89 @@ def create_backup() -> str:
     return backup_path
 
 
+# (path, time.monotonic()) of the last backup taken by maybe_backup()
+_last_backup: Optional[tuple] = None
+
+
+def maybe_backup() -> str:
+    """
+    Back up the config before a change, unless the previous backup is less
+    than BACKUP_MIN_INTERVAL seconds old and still matches the config.
+    Returns the path of the backup that covers the current config.
+    """
+    global _last_backup
+    if _last_backup is not None:
+        path, taken_at = _last_backup
+        if time.monotonic() - taken_at < BACKUP_MIN_INTERVAL:
+            try:
+                if filecmp.cmp(CONFIG_PATH, path, shallow=False):
+                    return path
+            except OSError:
+                pass
+
+    path = create_backup()
+    _last_backup = (path, time.monotonic())
+    return path
+
+
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'on'))
+
+
+def _parse_boolean(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+def _parse_integer(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _parse_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _parse_list(value: str) -> List[str]:
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+def _parse_string(value: str) -> str:
+    return value
+
+
+def _format_boolean(value: Any) -> str:
+    return str(bool(value))
+
+
+def _format_list(value: Any) -> str:
+    if isinstance(value, list):
+        return ','.join(str(v) for v in value)
+    return str(value)
+
+
+# Field type -> converter; any other type is kept as a plain string
+_VALUE_PARSERS = {
+    'boolean': _parse_boolean,
+    'integer': _parse_integer,
+    'float': _parse_float,
+    'list': _parse_list,
+}
+_VALUE_FORMATTERS = {
+    'boolean': _format_boolean,
+    'list': _format_list,
+}
+
+
 def parse_value(value: str, field_type: str) -> Any:
-    if field_type == 'boolean':
-        return value.lower() in ('true', '1', 'yes', 'on')
-    elif field_type == 'integer':
-        try:
-            return int(value)
-        except ValueError:
-            return 0
-    elif field_type == 'float':
-        try:
-            return float(value)
-        except ValueError:
-            return 0.0
-    elif field_type == 'list':
-        return [v.strip() for v in value.split(',') if v.strip()]
-    else:
-        return value
+    return _VALUE_PARSERS.get(field_type, _parse_string)(value)
 
 
 def format_value(value: Any, field_type: str) -> str:
-    if field_type == 'boolean':
-        return str(bool(value))
-    elif field_type == 'list':
-        if isinstance(value, list):
-            return ','.join(str(v) for v in value)
-        return str(value)
-    else:
-        return str(value)
+    return _VALUE_FORMATTERS.get(field_type, str)(value)
 
 
 def get_interface_section_name(num: int) -> str:
@@ -415,37 +747,117 @@ def get_interface_section_name(num: int) -> str:
     return f"interface{num}"
 
 
+# Serializes config read-modify-write sequences (backup, edit, write) across
+# the threadpool so concurrent requests can't interleave and lose updates
+_config_write_lock = threading.Lock()
+
+
+# ({key: default}, {key: value parser}) per interface kind, precomputed for
+# get_all_interfaces; the defaults dict is in field order
+_PRIMARY_FIELDS = (
+    {key: info.get('default', '') for key, info in PRIMARY_INTERFACE_FIELDS.items()},
+    {key: _VALUE_PARSERS.get(info['type'], _parse_string) for key, info in PRIMARY_INTERFACE_FIELDS.items()},
+)
+_INTERFACE_FIELDS = (
+    {key: info.get('default', '') for key, info in INTERFACE_FIELDS.items()},
+    {key: _VALUE_PARSERS.get(info['type'], _parse_string) for key, info in INTERFACE_FIELDS.items()},
+)
+
+# CONFIG_SCHEMA flattened to (section, key) -> field schema
+_SCHEMA_FIELDS = {
+    (section, key): field
+    for section, section_schema in CONFIG_SCHEMA.items()
+    for key, field in section_schema.get('fields', {}).items()
+}
+# section -> {key: field type}, so update loops do one lookup per section
+_SECTION_FIELD_TYPES = {
+    section: {key: field.get('type', 'string') for key, field in section_schema.get('fields', {}).items()}
+    for section, section_schema in CONFIG_SCHEMA.items()
+}
+
+
+# (sections, interfaces) for the last parse-cache sections dict seen by
+# get_all_interfaces; a new parse of config.ini brings a new sections dict
+_interfaces_cache: Optional[tuple] = None
+
+
 def get_all_interfaces(parser: ConfigParser) -> Dict[int, Dict[str, Any]]:
+    global _interfaces_cache
+    # Only parsers from ConfigParser.shared() hold the cached (never modified)
+    # sections dict, so only their results are safe to reuse
+    cached = ConfigParser._cache.get(parser.path)
+    shared = cached is not None and cached[4] is parser.sections
+    cache = _interfaces_cache
+    if shared and cache is not None and cache[0] is parser.sections:
+        return cache[1]
+
     interfaces = {}
     
     for i in range(1, 10):
-        section = get_interface_section_name(i)
-        if section in parser.sections:
-            config = {}
-            fields = PRIMARY_INTERFACE_FIELDS if i == 1 else INTERFACE_FIELDS
-            for key, field_info in fields.items():
-                raw_value = parser.sections[section].get(key, '')
+        section_dict = parser.sections.get(get_interface_section_name(i))
+        if section_dict is not None:
+            defaults, parsers = _PRIMARY_FIELDS if i == 1 else _INTERFACE_FIELDS
+            # Start from the defaults and overwrite only the fields set in the file
+            config = defaults.copy()
+            for key, raw_value in section_dict.items():
                 if raw_value:
-                    config[key] = parse_value(raw_value, field_info['type'])
-                else:
-                    config[key] = field_info.get('default', '')
+                    parse = parsers.get(key)
+                    if parse is not None:
+                        config[key] = parse(raw_value)
             interfaces[i] = config
-    
+
+    if shared:
+        _interfaces_cache = (parser.sections, interfaces)
     return interfaces
 
 
 # Schedule management functions
+# schedules.json stays the single snapshot the bot watches and reloads, so
+# every change is written out in full; the parsed list is cached here keyed
+# by (mtime_ns, size, inode) together with an id -> position index so reads
+# don't re-parse it and lookups don't scan it
+_schedules_cache: Optional[tuple] = None
+# Serializes load-modify-save sequences in the schedule endpoints
+_schedules_lock = threading.Lock()
+
+
+def _index_schedules(schedules: List[Dict]) -> Dict[Any, int]:
+    """Map each schedule id to the position of its first occurrence"""
+    index = {}
+    for i, s in enumerate(schedules):
+        index.setdefault(s.get('id'), i)
+    return index
+
+
+def load_schedules_indexed() -> Tuple[List[Dict], Dict[Any, int]]:
+    """Return (schedules, id index); the index is shared and must not be modified"""
+    global _schedules_cache
+    try:
+        st = os.stat(SCHEDULES_PATH)
+    except FileNotFoundError:
+        return [], {}
+
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cache = _schedules_cache
+    if cache is None or cache[0] != key:
+        with open(SCHEDULES_PATH, 'rb') as f:
+            data = orjson.loads(f.read())
+        schedules = data.get('schedules', [])
+        cache = _schedules_cache = (key, schedules, _index_schedules(schedules))
+    # Callers append/remove before saving, so hand out a copy of the list
+    return list(cache[1]), cache[2]
+
+
 def load_schedules() -> List[Dict]:
-    if SCHEDULES_PATH.exists():
-        with open(SCHEDULES_PATH, 'r') as f:
-            data = json.load(f)
-            return data.get('schedules', [])
-    return []
+    return load_schedules_indexed()[0]
 
 
 def save_schedules(schedules: List[Dict]) -> None:
-    with open(SCHEDULES_PATH, 'w') as f:
-        json.dump({'schedules': schedules}, f, indent=2)
+    global _schedules_cache
+    atomic_write_bytes(SCHEDULES_PATH, orjson.dumps({'schedules': schedules}, option=orjson.OPT_INDENT_2))
+    st = os.stat(SCHEDULES_PATH)
+    schedules = list(schedules)
+    _schedules_cache = ((st.st_mtime_ns, st.st_size, st.st_ino), schedules, _index_schedules(schedules))
 
 
 def get_next_schedule_id(schedules: List[Dict]) -> int:
@@ -455,30 +867,70 @@ def get_next_schedule_id(schedules: List[Dict]) -> int:
 
 
 # Scheduler Log Functions
+# In-memory scheduler log, loaded at startup and flushed by periodic_log_flush().
+# Stored column-wise (one bounded deque per field) rather than as a deque of
+# dicts; rows are only materialized when the log is read or flushed.
+_LOG_FIELDS = ("timestamp", "schedule_name", "action", "message", "channel", "interface", "status")
+_log_columns: Dict[str, deque] = {field: deque(maxlen=MAX_LOG_ENTRIES) for field in _LOG_FIELDS}
+_log_lock = threading.Lock()
+_log_dirty = False
+
+
+def _append_log_row(entry: Dict) -> None:
+    """Append one entry to the column store; caller holds _log_lock"""
+    for field in _LOG_FIELDS:
+        _log_columns[field].append(entry.get(field))
+
+
+def _clear_log_columns() -> None:
+    """Empty the column store; caller holds _log_lock"""
+    for column in _log_columns.values():
+        column.clear()
+
+
+def _log_rows() -> List[Dict]:
+    """Materialize the column store as a list of entry dicts; caller holds _log_lock"""
+    return [dict(zip(_LOG_FIELDS, row)) for row in zip(*_log_columns.values())]
+
+
+def read_scheduler_log_file() -> List[Dict]:
+    """Read scheduler activity log from disk"""
+    try:
+        with open(SCHEDULER_LOG_PATH, 'rb') as f:
+            data = orjson.loads(f.read())
+            return data.get('entries', [])
+    except (orjson.JSONDecodeError, IOError):
+        return []
+
+
 def load_scheduler_log() -> List[Dict]:
     """Load scheduler activity log"""
-    if SCHEDULER_LOG_PATH.exists():
-        try:
-            with open(SCHEDULER_LOG_PATH, 'r') as f:
-                data = json.load(f)
-                return data.get('entries', [])
-        except (json.JSONDecodeError, IOError):
-            return []
-    return []
+    with _log_lock:
+        return _log_rows()
+
+
+def flush_scheduler_log() -> None:
+    """Write the in-memory scheduler log to disk if it changed since the last flush"""
+    global _log_dirty
+    with _log_lock:
+        if not _log_dirty:
+            return
+        entries = _log_rows()
+        _log_dirty = False
+    save_scheduler_log(entries)
 
 
 def save_scheduler_log(entries: List[Dict]) -> None:
     """Save scheduler activity log, keeping only the last MAX_LOG_ENTRIES"""
     # Keep only the most recent entries
     entries = entries[-MAX_LOG_ENTRIES:] if len(entries) > MAX_LOG_ENTRIES else entries
-    with open(SCHEDULER_LOG_PATH, 'w') as f:
-        json.dump({'entries': entries}, f, indent=2)
+    atomic_write_bytes(SCHEDULER_LOG_PATH, orjson.dumps({'entries': entries}))
 
 
 def add_scheduler_log_entry(schedule_name: str, action: str, message: str,
                             channel: int, interface: int, status: str = "sent") -> Dict:
     """Add a new entry to the scheduler log"""
-    entries = load_scheduler_log()
+    global _log_dirty
     entry = {
         "timestamp": datetime.now().isoformat(),
         "schedule_name": schedule_name,
@@ -488,39 +940,86 @@ def add_scheduler_log_entry(schedule_name: str, action: str, message: str,
         "interface": interface,
         "status": status
     }
-    entries.append(entry)
-    save_scheduler_log(entries)
+    with _log_lock:
+        _append_log_row(entry)
+        _log_dirty = True
     return entry
 
 
 def clear_scheduler_log() -> None:
     """Clear all scheduler log entries"""
-    save_scheduler_log([])
+    global _log_dirty
+    with _log_lock:
+        _clear_log_columns()
+        _log_dirty = True
 
 
 def tail_file(filepath: str, max_lines: int = 2000, encoding: str = 'utf-8') -> List[str]:
     """
     Read the last max_lines from a file efficiently by seeking from the end.
-    Avoids reading the entire file into memory.
+    Reads fixed-size blocks backwards until enough newlines have been seen,
+    so only the needed tail is read and decoded.
     """
+    if max_lines <= 0:
+        return []
+
     try:
-        file_size = os.path.getsize(filepath)
-        if file_size == 0:
-            return []
+        with open(filepath, 'rb') as f:
+            raw_lines = _tail_raw_lines(f, f.seek(0, os.SEEK_END), max_lines)
+    except (IOError, OSError):
+        return []
 
-        # Estimate: average log line ~200 bytes, read 2x for safety
-        chunk_size = min(file_size, max_lines * 400)
+    return [line.decode(encoding, errors='ignore') for line in raw_lines]
 
-        with open(filepath, 'r', encoding=encoding, errors='ignore') as f:
-            # Seek to near the end
-            if file_size > chunk_size:
-                f.seek(file_size - chunk_size)
-                f.readline()  # Discard partial first line
-            lines = f.readlines()
 
-        return lines[-max_lines:] if len(lines) > max_lines else lines
+def iter_tail_lines(filepath: str, max_lines: int = 2000, encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Yield the last max_lines lines of a file newest first, like
+    reversed(tail_file(...)), but reading blocks backwards only as far as the
+    caller consumes, so a caller that stops early never reads the rest.
+    """
+    if max_lines <= 0:
+        return
+
+    try:
+        with open(filepath, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            carry = b''  # Partial line at the start of the previous block
+            while pos > 0:
+                read_size = min(TAIL_BLOCK_SIZE, pos)
+                pos -= read_size
+                f.seek(pos)
+                lines = (f.read(read_size) + carry).splitlines(keepends=True)
+                carry = lines.pop(0) if pos > 0 else b''
+                for line in reversed(lines):
+                    yield line.decode(encoding, errors='ignore')
+                    max_lines -= 1
+                    if max_lines == 0:
+                        return
     except (IOError, OSError):
-        return []
+        return
+
+
+def _tail_raw_lines(f, end: int, max_lines: int) -> List[bytes]:
+    """Return the last max_lines raw lines of an open binary file ending at offset end."""
+    pos = end
+    blocks = []
+    newlines = 0
+    # One extra newline guarantees the oldest kept line is complete
+    while pos > 0 and newlines <= max_lines:
+        read_size = min(TAIL_BLOCK_SIZE, pos)
+        pos -= read_size
+        f.seek(pos)
+        block = f.read(read_size)
+        blocks.append(block)
+        newlines += block.count(b'\n')
+
+    raw_lines = b''.join(reversed(blocks)).splitlines(keepends=True)
+    if pos > 0:
+        raw_lines = raw_lines[1:]  # Discard partial first line
+    if len(raw_lines) > max_lines:
+        raw_lines = raw_lines[-max_lines:]
+    return raw_lines
 
 
 def parse_meshbot_log(max_entries: int = MAX_LOG_ENTRIES) -> List[Dict]:
@@ -534,92 +1033,95 @@ def parse_meshbot_log(max_entries: int = MAX_LOG_ENTRIES) -> List[Dict]:
     - Send failure: "Exception during send_message: <error>"
     """
     entries = []
-    log_path = Path(MESHBOT_LOG_PATH)
 
-    if not log_path.exists():
-        return entries
-
-    lines = tail_file(str(log_path), max_lines=max_entries * 5)
+    # tail_file returns [] if the log doesn't exist yet
+    lines = tail_file(MESHBOT_LOG_PATH, max_lines=max_entries * 5)
     if not lines:
         return entries
 
-    # Regex patterns
-    # Channel send: 2025-11-28 14:38:41,970 |     INFO | Device:1 Channel:2 SendingChannel: bbslink MeshBot looking for peers
-    channel_send_pattern = re.compile(
-        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*Device:(\d+) Channel:(\d+) SendingChannel: (.+)$'
-    )
-    # Error patterns with capture groups for the error message
-    error_patterns = [
-        re.compile(r'Exception during send_message:\s*(.+)', re.IGNORECASE),
-        re.compile(r'Error Opening interface\d+ on:\s*(.+)', re.IGNORECASE),
-        re.compile(r'Error.*send.*?:\s*(.+)', re.IGNORECASE),
-        re.compile(r'failed to send.*?:\s*(.+)', re.IGNORECASE),
-        re.compile(r'\|\s*ERROR\s*\|\s*(.+)', re.IGNORECASE),
-    ]
-
-    # Process lines looking for channel sends
-    pending_send = None
+    # Scan the whole tail for sends and errors in one regex pass each, then
+    # walk just the matches in file order
+    blob = '\n'.join([line.strip() for line in lines])
+    matches = list(_CHANNEL_SEND_RE.finditer(blob))
+    if not matches:
+        return entries  # Errors only matter after a send, so skip that scan
+    send_offsets = {match.start() for match in matches}
+    # A send line is never also treated as an error line; errors before the
+    # first send have nothing to attach to
+    matches.extend(m for m in _ERROR_RE.finditer(blob, matches[0].end())
+                   if m.start() not in send_offsets)
+    matches.sort(key=lambda m: m.start())
 
-    for i, line in enumerate(lines):
-        line = line.strip()
+    pending_send = None
 
-        # Check for channel send
-        match = channel_send_pattern.match(line)
-        if match:
+    for match in matches:
+        # Channel send
+        if match.re is _CHANNEL_SEND_RE:
             timestamp_str, device, channel, message = match.groups()
 
             # If there's a pending send without error, mark it as sent
             if pending_send:
                 entries.append(pending_send)
 
-            # Create new pending entry
-            try:
-                # Parse timestamp
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                pending_send = {
-                    "timestamp": timestamp.isoformat(),
-                    "schedule_name": "Channel Broadcast",
-                    "action": "message",
-                    "message": message[:200] if message else "",
-                    "channel": int(channel),
-                    "interface": int(device),
-                    "status": "sent"  # Default to sent, will be changed if error found
-                }
-            except ValueError:
-                pending_send = None
+            # Create new pending entry. The regex guarantees the
+            # 'YYYY-MM-DD HH:MM:SS' shape, so swapping the separator yields
+            # the same ISO string a datetime round-trip would
+            pending_send = {
+                "timestamp": timestamp_str[:10] + 'T' + timestamp_str[11:],
+                "schedule_name": "Channel Broadcast",
+                "action": "message",
+                "message": message[:200] if message else "",
+                "channel": int(channel),
+                "interface": int(device),
+                "status": "sent"  # Default to sent, will be changed if error found
+            }
             continue
 
-        # Check for error immediately after a send attempt
+        # Error after a send attempt
         if pending_send:
-            for error_pattern in error_patterns:
-                error_match = error_pattern.search(line)
-                if error_match:
-                    pending_send["status"] = "failed"
-                    pending_send["error"] = error_match.group(1).strip() if error_match.lastindex else line.strip()
-                    entries.append(pending_send)
-                    pending_send = None
-                    break
-            if pending_send is None:
-                continue
+            pending_send["status"] = "failed"
+            pending_send["error"] = match.group(match.lastindex).strip()
+            entries.append(pending_send)
+            pending_send = None
 
     # Add last pending send if exists
     if pending_send:
         entries.append(pending_send)
 
-    # Sort by timestamp descending and limit
-    entries.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-    return entries[:max_entries]
+    # Top-k by timestamp descending; the tail can hold several times
+    # max_entries sends, so a bounded heap beats sorting them all. Every
+    # entry has a timestamp, so the C-level itemgetter can be the key.
+    return heapq.nlargest(max_entries, entries, key=itemgetter('timestamp'))
+
+
+# Last activity log parse keyed by the log's (mtime_ns, size, inode): (key, entries)
+_activity_log_cache: Optional[tuple] = None
 
 
 def get_activity_log() -> List[Dict]:
     """
     Get combined activity log from meshbot logs.
     Parses actual log file to show channel broadcasts with their send status.
+    The returned list is shared between callers while the log is unchanged.
     """
-    return parse_meshbot_log(MAX_LOG_ENTRIES)
+    global _activity_log_cache
+    try:
+        st = os.stat(MESHBOT_LOG_PATH)
+    except FileNotFoundError:
+        return []
+
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cache = _activity_log_cache
+    if cache is not None and cache[0] == key:
+        return cache[1]
+
+    entries = parse_meshbot_log(MAX_LOG_ENTRIES)
+    _activity_log_cache = (key, entries)
+    return entries
 
 
-def get_meshbot_logs(max_lines: int = 500, level: str = None, search: str = None) -> List[Dict]:
+def get_meshbot_logs(max_lines: int = 500, level: str = None, search: str = None,
+                     count_levels: bool = False):
     """
     Get meshbot log entries with optional filtering.
 
@@ -627,42 +1129,38 @@ def get_meshbot_logs(max_lines: int = 500, level: str = None, search: str = None
         max_lines: Maximum number of lines to return
         level: Filter by log level (DEBUG, INFO, WARNING, ERROR)
         search: Search term to filter messages
+        count_levels: Also return per-level counts of the returned entries
 
     Returns:
-        List of log entry dictionaries with timestamp, level, source, message
+        List of log entry dictionaries with timestamp, level, source, message,
+        or (entries, level_counts) if count_levels is set
     """
-    log_path = Path(MESHBOT_LOG_PATH)
     entries = []
+    level_counts = dict.fromkeys(_LOG_LEVELS, 0)
 
-    if not log_path.exists():
-        return entries
-
-    # Read enough lines to satisfy the request after filtering
+    # Look back far enough to satisfy the request after filtering
     read_count = max_lines * 10 if (level or search) else max_lines * 2
-    lines = tail_file(str(log_path), max_lines=read_count)
-    if not lines:
-        return entries
 
-    # Log pattern: 2025-11-28 17:02:55,911 |    DEBUG | System: Message here
-    log_pattern = re.compile(
-        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|\s*(DEBUG|INFO|WARNING|ERROR)\s*\|\s*(.+)$'
-    )
+    log_re = _LOG_RE_BY_LEVEL.get(level.upper()) if level else _LOG_RE
+    if log_re is None:
+        # Not a level any line can have
+        return (entries, level_counts) if count_levels else entries
+    search_filter = search.lower() if search else None
 
-    for line in lines:
+    # Walk newest first so we can stop as soon as max_lines entries are kept;
+    # the file is only read as far back as that takes
+    for line in iter_tail_lines(MESHBOT_LOG_PATH, max_lines=read_count):
         line = line.strip()
-        # Remove ANSI color codes
-        line = re.sub(r'\x1b\[[0-9;]*m', '', line)
+        # Remove ANSI color codes (most lines have none, so skip the regex)
+        if '\x1b' in line:
+            line = _ANSI_RE.sub('', line)
 
-        match = log_pattern.match(line)
+        match = log_re.match(line)
         if match:
             timestamp_str, log_level, message = match.groups()
 
-            # Filter by level if specified
-            if level and log_level != level.upper():
-                continue
-
             # Filter by search term if specified
-            if search and search.lower() not in message.lower():
+            if search_filter and search_filter not in message.lower():
                 continue
 
             # Parse source and message
@@ -679,9 +1177,24 @@ def get_meshbot_logs(max_lines: int = 500, level: str = None, search: str = None
                 "source": source,
                 "message": msg_content
             })
+            level_counts[log_level] += 1
+            if len(entries) >= max_lines:
+                break
+
+    # Return last N entries (most recent) in file order
+    entries.reverse()
+    return (entries, level_counts) if count_levels else entries
+
 
-    # Return last N entries (most recent)
-    return entries[-max_lines:] if len(entries) > max_lines else entries
+# Log file reads, parsing and compression run here instead of on the event
+# loop; the small fixed pool bounds how many can hit the disk at once
+_log_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='log-parse')
+
+
+async def run_log_task(func, *args, **kwargs):
+    """Run a blocking log function on the log executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_log_executor, functools.partial(func, *args, **kwargs))
 
 
 # Log Archive Functions
@@ -709,10 +1222,14 @@ def archive_current_log() -> Optional[str]:
         archive_name = f"meshbot_{timestamp}.log.gz"
         archive_path = archive_dir / archive_name
 
-        # Read and compress the log
+        # Read and compress the log (zlib level 6 is much faster than the default
+        # 9 for a few percent larger output; 1 MiB chunks keep the copy loop short)
         with open(log_path, 'rb') as f_in:
-            with gzip.open(archive_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+            # Let the kernel read ahead aggressively while we compress
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f_in.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with fast_gzip.open(archive_path, 'wb', compresslevel=ARCHIVE_COMPRESSLEVEL) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
 
         return archive_name
     except Exception as e:
@@ -720,49 +1237,65 @@ def archive_current_log() -> Optional[str]:
         return None
 
 
+def _archive_stamp(name: str) -> Optional[str]:
+    """The YYYYMMDD_HHMMSS stamp of a meshbot_YYYYMMDD_HHMMSS.log.gz name, or None"""
+    ts_str = name[8:23]
+    if len(ts_str) != 15 or ts_str[8] != '_' or not (ts_str[:8].isdigit() and ts_str[9:].isdigit()):
+        return None
+    return ts_str
+
+
 def cleanup_old_archives():
     """Remove archives older than LOG_RETENTION_DAYS."""
-    archive_dir = Path(LOG_ARCHIVE_DIR)
-    if not archive_dir.exists():
-        return
+    # Archive names embed a fixed-width YYYYMMDD_HHMMSS stamp, which sorts
+    # lexically, so compare strings rather than parsing every filename
+    cutoff_str = (datetime.now() - timedelta(days=LOG_RETENTION_DAYS)).strftime("%Y%m%d_%H%M%S")
 
-    cutoff = datetime.now() - timedelta(days=LOG_RETENTION_DAYS)
+    try:
+        with os.scandir(LOG_ARCHIVE_DIR) as it:
+            archive_entries = [e for e in it if e.name.startswith('meshbot_') and e.name.endswith('.log.gz')]
+    except FileNotFoundError:
+        return
 
-    for archive_file in archive_dir.glob("meshbot_*.log.gz"):
-        try:
-            # Parse timestamp from filename: meshbot_YYYYMMDD_HHMMSS.log.gz
-            name_parts = archive_file.stem.replace('.log', '').split('_')
-            if len(name_parts) >= 3:
-                date_str = f"{name_parts[1]}_{name_parts[2]}"
-                file_date = datetime.strptime(date_str, "%Y%m%d_%H%M%S")
-                if file_date < cutoff:
-                    archive_file.unlink()
-        except (ValueError, IndexError):
+    for entry in archive_entries:
+        ts_str = _archive_stamp(entry.name)
+        if ts_str is None:
             continue
+        if ts_str < cutoff_str:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
 
 
 def get_log_archives() -> List[Dict]:
     """Get list of available log archives."""
-    archive_dir = Path(LOG_ARCHIVE_DIR)
-    if not archive_dir.exists():
+    # scandir entries carry their stat info, so no extra stat per file
+    try:
+        with os.scandir(LOG_ARCHIVE_DIR) as it:
+            archive_entries = [e for e in it if e.name.startswith('meshbot_') and e.name.endswith('.log.gz')]
+    except FileNotFoundError:
         return []
+    archive_entries.sort(key=lambda e: e.name, reverse=True)
 
     archives = []
-    for archive_file in sorted(archive_dir.glob("meshbot_*.log.gz"), reverse=True):
+    for entry in archive_entries:
         try:
-            stat = archive_file.stat()
-            # Parse date from filename
-            name_parts = archive_file.stem.replace('.log', '').split('_')
-            if len(name_parts) >= 3:
-                date_str = f"{name_parts[1]}_{name_parts[2]}"
-                file_date = datetime.strptime(date_str, "%Y%m%d_%H%M%S")
-                archives.append({
-                    "filename": archive_file.name,
-                    "date": file_date.isoformat(),
-                    "size": stat.st_size,
-                    "size_human": f"{stat.st_size / 1024:.1f} KB"
-                })
-        except (ValueError, IndexError):
+            # Build the date from the fixed-width stamp directly; strptime
+            # is far slower for a format this simple
+            ts_str = _archive_stamp(entry.name)
+            if ts_str is None:
+                continue
+            file_date = datetime(int(ts_str[:4]), int(ts_str[4:6]), int(ts_str[6:8]),
+                                 int(ts_str[9:11]), int(ts_str[11:13]), int(ts_str[13:]))
+            stat = entry.stat()
+            archives.append({
+                "filename": entry.name,
+                "date": file_date.isoformat(),
+                "size": stat.st_size,
+                "size_human": f"{stat.st_size / 1024:.1f} KB"
+            })
+        except (ValueError, FileNotFoundError):
             continue
 
     return archives
@@ -770,18 +1303,43 @@ def get_log_archives() -> List[Dict]:
 
 def read_archive(filename: str, max_lines: int = 1000) -> List[str]:
     """Read contents of an archived log file."""
-    archive_path = Path(LOG_ARCHIVE_DIR) / filename
-    if not archive_path.exists() or not filename.endswith('.gz'):
+    if not filename.endswith('.gz'):
         return []
 
+    archive_path = os.path.join(LOG_ARCHIVE_DIR, filename)
     try:
-        with gzip.open(archive_path, 'rt', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        return lines[-max_lines:] if len(lines) > max_lines else lines
+        with fast_gzip.open(archive_path, 'rt', encoding='utf-8', errors='ignore') as f:
+            if max_lines <= 0:
+                return f.readlines()[-max_lines:]
+            # Only the last max_lines are kept while decompressing
+            return list(deque(f, maxlen=max_lines))
     except Exception:
         return []
 
 
+def stream_archive(archive_path: str, max_lines: Optional[int] = None):
+    """
+    Yield an archive's lines as NDJSON ({"line": ...} per line), batched
+    into ~64 KiB chunks. The archive is only opened once iteration starts, so
+    a response that is never sent leaves no file handle behind.
+    """
+    with fast_gzip.open(archive_path, 'rt', encoding='utf-8', errors='ignore') as f:
+        chunk = []
+        size = 0
+        for line in itertools.islice(f, max_lines):
+            item = orjson.dumps({"line": line})
+            chunk.append(item)
+            size += len(item) + 1
+            if size >= TAIL_BLOCK_SIZE:
+                chunk.append(b'')
+                yield b'\n'.join(chunk)
+                chunk = []
+                size = 0
+        if chunk:
+            chunk.append(b'')
+            yield b'\n'.join(chunk)
+
+
 # API Routes
 
 @app.get("/", response_class=HTMLResponse)
@@ -894,14 +1452,18 @@ async def auth_status():
     return {"auth_enabled": AUTH_ENABLED, "oidc_enabled": OIDC_ENABLED}
 
 
+# The schema is static, so its response body is serialized once at import
+_SCHEMA_RESPONSE_BODY = orjson.dumps({
+    "schema": CONFIG_SCHEMA,
+    "order": SECTION_ORDER,
+    "interfaceFields": INTERFACE_FIELDS,
+    "primaryInterfaceFields": PRIMARY_INTERFACE_FIELDS
+})
+
+
 @app.get("/api/schema")
 async def get_schema():
-    return {
-        "schema": CONFIG_SCHEMA,
-        "order": SECTION_ORDER,
-        "interfaceFields": INTERFACE_FIELDS,
-        "primaryInterfaceFields": PRIMARY_INTERFACE_FIELDS
-    }
+    return Response(content=_SCHEMA_RESPONSE_BODY, media_type="application/json")
 
 
 # Schedule endpoints
@@ -909,51 +1471,55 @@ async def get_schema():
 @app.get("/api/schedules")
 def get_schedules():
     """Get all custom schedules"""
-    schedules = load_schedules()
-    return {"schedules": schedules}
+    # Plain dicts straight from the cache: hand them to orjson directly
+    # instead of walking them through jsonable_encoder first
+    return ORJSONResponse({"schedules": load_schedules()})
 
 
 @app.get("/api/schedules/{schedule_id}")
 def get_schedule(schedule_id: int):
     """Get a specific schedule"""
-    schedules = load_schedules()
-    for s in schedules:
-        if s.get('id') == schedule_id:
-            return {"schedule": s}
+    schedules, index = load_schedules_indexed()
+    i = index.get(schedule_id)
+    if i is not None:
+        return ORJSONResponse({"schedule": schedules[i]})
     raise HTTPException(status_code=404, detail="Schedule not found")
 
 
 @app.post("/api/schedules")
 def create_schedule(schedule: ScheduleItem):
     """Create a new schedule"""
-    schedules = load_schedules()
-    new_schedule = schedule.model_dump()
-    new_schedule['id'] = get_next_schedule_id(schedules)
-    schedules.append(new_schedule)
-    save_schedules(schedules)
-    return {"success": True, "schedule": new_schedule}
+    with _schedules_lock:
+        schedules = load_schedules()
+        new_schedule = schedule.model_dump()
+        new_schedule['id'] = get_next_schedule_id(schedules)
+        schedules.append(new_schedule)
+        save_schedules(schedules)
+    return ORJSONResponse({"success": True, "schedule": new_schedule})
 
 
 @app.put("/api/schedules/{schedule_id}")
 def update_schedule(schedule_id: int, schedule: ScheduleItem):
     """Update an existing schedule"""
-    schedules = load_schedules()
-    for i, s in enumerate(schedules):
-        if s.get('id') == schedule_id:
+    with _schedules_lock:
+        schedules, index = load_schedules_indexed()
+        i = index.get(schedule_id)
+        if i is not None:
             updated = schedule.model_dump()
             updated['id'] = schedule_id
             schedules[i] = updated
             save_schedules(schedules)
-            return {"success": True, "schedule": updated}
+            return ORJSONResponse({"success": True, "schedule": updated})
     raise HTTPException(status_code=404, detail="Schedule not found")
 
 
 @app.delete("/api/schedules/{schedule_id}")
 def delete_schedule(schedule_id: int):
     """Delete a schedule"""
-    schedules = load_schedules()
-    for i, s in enumerate(schedules):
-        if s.get('id') == schedule_id:
+    with _schedules_lock:
+        schedules, index = load_schedules_indexed()
+        i = index.get(schedule_id)
+        if i is not None:
             del schedules[i]
             save_schedules(schedules)
             return {"success": True, "deleted": schedule_id}
@@ -963,9 +1529,9 @@ def delete_schedule(schedule_id: int):
 # Scheduler Log endpoints
 
 @app.get("/api/scheduler/log")
-def get_scheduler_log():
+async def get_scheduler_log():
     """Get activity log from meshbot logs (channel broadcasts only, no DMs)"""
-    entries = get_activity_log()
+    entries = await run_log_task(get_activity_log)
     return {"entries": entries}
 
 
@@ -992,7 +1558,7 @@ def delete_scheduler_log():
 # Log viewer endpoints
 
 @app.get("/api/logs")
-def get_logs(
+async def get_logs(
     lines: int = 500,
     level: Optional[str] = None,
     search: Optional[str] = None
@@ -1005,14 +1571,9 @@ def get_logs(
         level: Filter by log level (DEBUG, INFO, WARNING, ERROR)
         search: Search term to filter messages
     """
-    entries = get_meshbot_logs(max_lines=lines, level=level, search=search)
-
-    # Count by level for stats
-    level_counts = {"DEBUG": 0, "INFO": 0, "WARNING": 0, "ERROR": 0}
-    for entry in entries:
-        lvl = entry.get("level", "")
-        if lvl in level_counts:
-            level_counts[lvl] += 1
+    entries, level_counts = await run_log_task(
+        get_meshbot_logs, max_lines=lines, level=level, search=search, count_levels=True
+    )
 
     return {
         "entries": entries,
@@ -1040,21 +1601,21 @@ def list_archives():
 
 
 @app.post("/api/logs/archive")
-def create_archive():
+async def create_archive():
     """Create a new archive of the current log."""
-    filename = archive_current_log()
+    filename = await run_log_task(archive_current_log)
     if filename:
         return {"success": True, "filename": filename}
     raise HTTPException(status_code=500, detail="Failed to create archive")
 
 
 @app.get("/api/logs/archives/{filename}")
-def get_archive_content(filename: str, lines: int = 1000):
+async def get_archive_content(filename: str, lines: int = 1000):
     """Get contents of a specific archive."""
     if not filename.endswith('.gz') or '..' in filename:
         raise HTTPException(status_code=400, detail="Invalid filename")
 
-    content = read_archive(filename, max_lines=lines)
+    content = await run_log_task(read_archive, filename, max_lines=lines)
     if not content:
         raise HTTPException(status_code=404, detail="Archive not found")
 
@@ -1065,6 +1626,19 @@ def get_archive_content(filename: str, lines: int = 1000):
     }
 
 
+@app.get("/api/logs/archives/{filename}/stream")
+def stream_archive_content(filename: str, lines: Optional[int] = Query(None, ge=0)):
+    """Stream an archive from the start as NDJSON, optionally stopping after `lines` lines."""
+    if not filename.endswith('.gz') or '..' in filename:
+        raise HTTPException(status_code=400, detail="Invalid filename")
+
+    archive_path = os.path.join(LOG_ARCHIVE_DIR, filename)
+    if not os.path.isfile(archive_path):
+        raise HTTPException(status_code=404, detail="Archive not found")
+
+    return StreamingResponse(stream_archive(archive_path, lines), media_type="application/x-ndjson")
+
+
 @app.delete("/api/logs/archives/{filename}")
 def delete_archive(filename: str):
     """Delete a specific archive."""
@@ -1085,6 +1659,35 @@ def delete_archive(filename: str):
 # Packet Monitor endpoints
 PACKET_BUFFER_PATH = os.environ.get("PACKET_BUFFER_PATH", "/opt/meshing-around/data/packets.json")
 
+# Parsed packet buffer keyed by (mtime_ns, size, inode): (key, packets, timestamps, in_order)
+_packet_cache: Optional[tuple] = None
+
+
+def load_packets() -> tuple:
+    """
+    Load the packet buffer, reusing the parsed copy while the file is unchanged.
+    Returns (packets, timestamps, in_order) where timestamps holds each packet's
+    timestamp_full and in_order says whether they are sorted ascending.
+    """
+    global _packet_cache
+    try:
+        st = os.stat(PACKET_BUFFER_PATH)
+    except FileNotFoundError:
+        return [], [], True
+
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cache = _packet_cache
+    if cache is not None and cache[0] == key:
+        return cache[1:]
+
+    with open(PACKET_BUFFER_PATH, 'rb') as f:
+        packets = loads_json(f.read())
+    timestamps = [p.get('timestamp_full', '') for p in packets]
+    in_order = all(a <= b for a, b in zip(timestamps, timestamps[1:]))
+    _packet_cache = (key, packets, timestamps, in_order)
+    return packets, timestamps, in_order
+
+
 @app.get("/api/packets")
 def get_packets(since: Optional[str] = None):
     """
@@ -1094,15 +1697,15 @@ def get_packets(since: Optional[str] = None):
         since: Only return packets after this timestamp (ISO format)
     """
     try:
-        if not os.path.exists(PACKET_BUFFER_PATH):
-            return {"packets": [], "total": 0}
+        packets, timestamps, in_order = load_packets()
         
-        with open(PACKET_BUFFER_PATH, 'r') as f:
-            packets = json.load(f)
-        
-        # Filter by timestamp if provided
+        # Filter by timestamp if provided; the bot appends packets in time
+        # order, so a binary search finds the cut point
         if since:
-            packets = [p for p in packets if p.get('timestamp_full', '') > since]
+            if in_order:
+                packets = packets[bisect.bisect_right(timestamps, since):]
+            else:
+                packets = [p for p, ts in zip(packets, timestamps) if ts > since]
         
         return {
             "packets": packets,
@@ -1116,8 +1719,8 @@ def clear_packets():
     """Clear all packet monitor entries."""
     try:
         if os.path.exists(PACKET_BUFFER_PATH):
-            with open(PACKET_BUFFER_PATH, 'w') as f:
-                json.dump([], f)
+            with open(PACKET_BUFFER_PATH, 'wb') as f:
+                f.write(orjson.dumps([]))
         return {"success": True, "message": "Packet buffer cleared"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1125,29 +1728,86 @@ def clear_packets():
 
 # BBS Network endpoints
 
-def load_bbs_peers() -> Dict:
-    """Load BBS peers data from file."""
-    if not os.path.exists(BBS_PEERS_PATH):
-        return {"peers": {}, "last_updated": None}
+# In-memory BBS peers data, loaded on first use and flushed by periodic_bbs_peers_flush()
+_bbs_peers: Optional[Dict] = None
+_bbs_peers_lock = threading.RLock()
+_bbs_peers_dirty = False
+# Bumped by clear_bbs_peers; a flush whose snapshot predates the current
+# generation must not write it back
+_bbs_peers_generation = 0
+# Serializes writes and removal of BBS_PEERS_PATH, which happen outside _bbs_peers_lock
+_bbs_peers_file_lock = threading.Lock()
+
+
+def read_bbs_peers_file() -> Dict:
+    """Read BBS peers data from disk"""
     try:
-        with open(BBS_PEERS_PATH, 'r') as f:
-            return json.load(f)
+        with open(BBS_PEERS_PATH, 'rb') as f:
+            return loads_json(f.read())
     except (json.JSONDecodeError, IOError):
         return {"peers": {}, "last_updated": None}
 
 
+def load_bbs_peers() -> Dict:
+    """Load BBS peers data; the returned dict is the live copy, so hold _bbs_peers_lock while using it"""
+    global _bbs_peers
+    with _bbs_peers_lock:
+        if _bbs_peers is None:
+            _bbs_peers = read_bbs_peers_file()
+        return _bbs_peers
+
+
 def save_bbs_peers(data: Dict) -> None:
-    """Save BBS peers data to file with atomic write."""
-    data["last_updated"] = datetime.now().isoformat()
-    temp_path = BBS_PEERS_PATH + ".tmp"
-    try:
-        with open(temp_path, 'w') as f:
-            json.dump(data, f, indent=2)
-        os.replace(temp_path, BBS_PEERS_PATH)
-    except IOError as e:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-        raise e
+    """Save BBS peers data; written to disk by the next flush"""
+    global _bbs_peers, _bbs_peers_dirty
+    with _bbs_peers_lock:
+        data["last_updated"] = datetime.now().isoformat()
+        _bbs_peers = data
+        _bbs_peers_dirty = True
+
+
+def flush_bbs_peers() -> None:
+    """Write the in-memory BBS peers data to disk if it changed since the last flush"""
+    global _bbs_peers_dirty
+    with _bbs_peers_lock:
+        if not _bbs_peers_dirty:
+            return
+        payload = orjson.dumps(_bbs_peers)
+        generation = _bbs_peers_generation
+        _bbs_peers_dirty = False
+    with _bbs_peers_file_lock:
+        # The peers were cleared after this snapshot was taken
+        if generation != _bbs_peers_generation:
+            return
+        atomic_write_bytes(BBS_PEERS_PATH, payload)
+
+
+# Incremental parse state for the meshbot log: events are kept with their
+# line number so the window matches a tail of BBS_LOG_TAIL_LINES lines
+BBS_LOG_TAIL_LINES = 5000
+_bbs_parse_state = {'inode': None, 'offset': 0, 'marker': b'', 'lines': 0, 'events': deque()}
+_bbs_parse_lock = threading.Lock()
+
+
+def _reset_bbs_parse_state(inode: Optional[int]) -> None:
+    """Forget parsed BBS events; caller holds _bbs_parse_lock"""
+    _bbs_parse_state.update(inode=inode, offset=0, marker=b'', lines=0)
+    _bbs_parse_state['events'].clear()
+
+
+def _parse_bbs_event_line(line: str) -> Optional[Dict]:
+    """Parse one meshbot log line into a BBS event dict, or None"""
+    match = _BBS_EVENT_RE.match(line.strip())
+    if not match:
+        return None
+
+    event_type = match.lastgroup
+    start, fields = _BBS_EVENT_FIELDS[event_type]
+    values = match.groups()
+    event = {'timestamp': values[start], 'type': event_type}
+    for offset, (key, convert) in enumerate(fields, start + 1):
+        event[key] = convert(values[offset]) if convert else values[offset]
+    return event
 
 
 def parse_bbs_events_from_log() -> List[Dict]:
@@ -1162,274 +1822,250 @@ def parse_bbs_events_from_log() -> List[Dict]:
     - Wait to sync: "System: wait to bbslink with peer NODEID"
     - Sending sync: "System: Sending bbslink message N of M to peer NODEID"
     - Sync complete: "System: bbslink sync complete with peer NODEID"
-    """
-    events = []
-    log_path = Path(MESHBOT_LOG_PATH)
 
-    if not log_path.exists():
-        return events
+    Only lines appended since the previous call are parsed; the log is
+    re-read from its tail after rotation or truncation.
+    """
+    state = _bbs_parse_state
+    with _bbs_parse_lock:
+        try:
+            f = open(MESHBOT_LOG_PATH, 'rb')
+        except (IOError, OSError):
+            _reset_bbs_parse_state(None)
+            return []
 
-    lines = tail_file(str(log_path), max_lines=5000)
-    if not lines:
-        return events
-
-    # Regex patterns for BBS events
-    patterns = {
-        # Channel broadcast sent
-        'broadcast_sent': re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*Device:(\d+) Channel:(\d+) SendingChannel: (bbslink.*)$',
-            re.IGNORECASE
-        ),
-        # Channel message received with node name
-        'broadcast_received': re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*Device:(\d+) Channel:(\d+) ReceivedChannel: (bbslink.*) From: (.+)$',
-            re.IGNORECASE
-        ),
-        # DM sent with node name
-        'dm_sent': re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*Device:(\d+) Sending DM: (bbslink.*|bbsack.*) To: (.+)$',
-            re.IGNORECASE
-        ),
-        # DM received with node name
-        'dm_received': re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*Device:(\d+) Channel: (\d+) Received DM: (bbslink.*|bbsack.*) From: (.+)$',
-            re.IGNORECASE
-        ),
-        # Debug: wait to sync
-        'wait_sync': re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*System: wait to bbslink with peer (\d+)$'
-        ),
-        # Debug: sending message
-        'sending_sync': re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*System: Sending bbslink message (\d+) of (\d+) to peer (\d+)$'
-        ),
-        # Debug: sync complete
-        'sync_complete': re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \|.*System: bbslink sync complete with peer (\d+)$'
-        ),
-    }
+        with f:
+            st = os.fstat(f.fileno())
+            offset = state['offset']
+            # If the bytes just before the saved offset changed, the log was
+            # truncated and rewritten in place since the last call
+            marker = state['marker']
+            f.seek(offset - len(marker))
+            if (st.st_ino != state['inode'] or st.st_size < offset
+                    or f.read(len(marker)) != marker):
+                # First call, rotation or truncation: rebuild from the tail
+                _reset_bbs_parse_state(st.st_ino)
+                data = b''.join(_tail_raw_lines(f, st.st_size, BBS_LOG_TAIL_LINES))
+                base = st.st_size - len(data)
+            else:
+                # Only parse what was appended since the last call
+                data = f.read(st.st_size - offset)
+                base = offset
+
+        # Leave a partially written last line for the next call
+        complete = data.rfind(b'\n') + 1
+        state['offset'] = base + complete
+        state['marker'] = (state['marker'] + data[:complete])[-64:]
+
+        events = state['events']
+        line_no = state['lines']
+        data = data[:complete]
+        if b'\r' in data:
+            for raw_line in data.splitlines():
+                line_no += 1
+                line = raw_line.decode('utf-8', errors='ignore')
+                # Every BBS pattern contains bbslink/bbsack, so skip the regex
+                # for the bulk of lines that cannot match
+                if 'bbs' not in line.lower():
+                    continue
+                event = _parse_bbs_event_line(line)
+                if event:
+                    events.append((line_no, event))
+        else:
+            # '\n' is the only line break here, so jump between the lines that
+            # mention bbs and count the newlines skipped over instead of
+            # decoding every line
+            pos = 0  # Start of the first line not yet counted
+            for hit in _BBS_HINT_RE.finditer(data):
+                if hit.start() < pos:
+                    continue  # Another hit on a line already handled
+                line_start = data.rfind(b'\n', 0, hit.start()) + 1
+                line_end = data.index(b'\n', hit.start())
+                line_no += data.count(b'\n', pos, line_start) + 1
+                event = _parse_bbs_event_line(data[line_start:line_end].decode('utf-8', errors='ignore'))
+                if event:
+                    events.append((line_no, event))
+                pos = line_end + 1
+            line_no += data.count(b'\n', pos)
+        state['lines'] = line_no
+
+        # Keep only events within the last BBS_LOG_TAIL_LINES lines
+        while events and events[0][0] <= line_no - BBS_LOG_TAIL_LINES:
+            events.popleft()
+
+        return [event for _, event in events]
+
+
+def bbs_timestamp_epoch(timestamp: Optional[str]) -> Optional[float]:
+    """Convert a BBS event timestamp to epoch seconds, or None if it can't be parsed"""
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (ValueError, TypeError):
+        return None
 
-    for line in lines:
-        line = line.strip()
 
-        # Check broadcast sent
-        match = patterns['broadcast_sent'].match(line)
-        if match and 'bbslink' in match.group(4).lower():
-            events.append({
-                'timestamp': match.group(1),
-                'type': 'broadcast_sent',
-                'device': int(match.group(2)),
-                'channel': int(match.group(3)),
-                'message': match.group(4)
-            })
-            continue
-
-        # Check broadcast received
-        match = patterns['broadcast_received'].match(line)
-        if match and 'bbslink' in match.group(4).lower():
-            events.append({
-                'timestamp': match.group(1),
-                'type': 'broadcast_received',
-                'device': int(match.group(2)),
-                'channel': int(match.group(3)),
-                'message': match.group(4),
-                'node_name': match.group(5)
-            })
-            continue
-
-        # Check DM sent
-        match = patterns['dm_sent'].match(line)
-        if match:
-            events.append({
-                'timestamp': match.group(1),
-                'type': 'dm_sent',
-                'device': int(match.group(2)),
-                'message': match.group(3),
-                'node_name': match.group(4)
-            })
-            continue
-
-        # Check DM received
-        match = patterns['dm_received'].match(line)
-        if match:
-            events.append({
-                'timestamp': match.group(1),
-                'type': 'dm_received',
-                'device': int(match.group(2)),
-                'channel': int(match.group(3)),
-                'message': match.group(4),
-                'node_name': match.group(5)
-            })
-            continue
-
-        # Check wait sync
-        match = patterns['wait_sync'].match(line)
-        if match:
-            events.append({
-                'timestamp': match.group(1),
-                'type': 'wait_sync',
-                'node_id': int(match.group(2))
-            })
-            continue
-
-        # Check sending sync
-        match = patterns['sending_sync'].match(line)
-        if match:
-            events.append({
-                'timestamp': match.group(1),
-                'type': 'sending_sync',
-                'message_num': int(match.group(2)),
-                'total_messages': int(match.group(3)),
-                'node_id': int(match.group(4))
-            })
-            continue
-
-        # Check sync complete
-        match = patterns['sync_complete'].match(line)
-        if match:
-            events.append({
-                'timestamp': match.group(1),
-                'type': 'sync_complete',
-                'node_id': int(match.group(2))
-            })
-
-    return events
-
-
-def update_bbs_peers_from_events(events: List[Dict]) -> Dict:
-    """
-    Update BBS peers data structure from parsed events.
-    Returns updated peers dictionary.
-    """
-    data = load_bbs_peers()
-    peers = data.get("peers", {})
+def update_bbs_peers_from_events(events: List[Dict]) -> Dict:
+    """
+    Update BBS peers data structure from parsed events.
+    Returns updated peers dictionary.
+    """
+    data = load_bbs_peers()
+    peers = data.get("peers", {})
+    # Peers whose last_seen moved; their epoch is converted once after the loop
+    # rather than on every event
+    seen_changed = set()
 
     for event in events:
-        node_key = None
         node_name = event.get('node_name')
         node_id = event.get('node_id')
 
         # Determine node key (use name if available, otherwise ID)
-        if node_name:
-            node_key = node_name
-        elif node_id:
-            node_key = str(node_id)
-
+        node_key = node_name or (str(node_id) if node_id else None)
         if not node_key:
             continue
 
-        # Initialize peer if not exists
-        if node_key not in peers:
-            peers[node_key] = {
+        timestamp = event['timestamp']
+        event_type = event['type']
+        peer = peers.get(node_key)
+
+        if peer is None:
+            # Initialize peer if not exists
+            peer = peers[node_key] = {
                 'node_name': node_name or f"Node {node_id}",
                 'node_id': node_id,
-                'first_seen': event['timestamp'],
-                'last_seen': event['timestamp'],
+                'first_seen': timestamp,
+                'last_seen': timestamp,
+                'last_seen_epoch': None,
                 'sync_count': 0,
                 'messages_synced': 0,
                 'last_sync_type': None,
                 'sync_history': []
             }
-
-        peer = peers[node_key]
-
-        # Update last seen
-        if event['timestamp'] > peer.get('last_seen', ''):
-            peer['last_seen'] = event['timestamp']
+            seen_changed.add(node_key)
+        elif timestamp > peer.get('last_seen', ''):
+            # Update last seen
+            peer['last_seen'] = timestamp
+            seen_changed.add(node_key)
 
         # Update node_id if we have it now
         if node_id and not peer.get('node_id'):
             peer['node_id'] = node_id
 
-        # Track sync events
-        sync_event = {
-            'timestamp': event['timestamp'],
-            'type': event['type'],
+        # Keep only last 20 sync events per peer, trimming in place
+        history = peer.setdefault('sync_history', [])
+        if len(history) > 19:
+            del history[:-19]
+        history.append({
+            'timestamp': timestamp,
+            'type': event_type,
             'details': event.get('message', '')[:100]
-        }
-
-        # Keep only last 20 sync events per peer
-        peer['sync_history'] = peer.get('sync_history', [])[-19:] + [sync_event]
+        })
 
         # Update sync statistics
-        if event['type'] in ('sync_complete', 'dm_sent', 'dm_received'):
+        if event_type in ('sync_complete', 'dm_sent', 'dm_received'):
             peer['sync_count'] = peer.get('sync_count', 0) + 1
-            peer['last_sync_type'] = event['type']
-
-        if event['type'] == 'sending_sync':
+            peer['last_sync_type'] = event_type
+        elif event_type == 'sending_sync':
             peer['messages_synced'] = max(
                 peer.get('messages_synced', 0),
                 event.get('total_messages', 0)
             )
 
+    for node_key in seen_changed:
+        peer = peers[node_key]
+        peer['last_seen_epoch'] = bbs_timestamp_epoch(peer['last_seen'])
+
     data['peers'] = peers
     return data
 
 
-@app.get("/api/bbs/peers")
-def get_bbs_peers(refresh: bool = False):
+def list_bbs_peers(refresh: bool = False) -> Dict:
     """
-    Get BBS network peer information.
-
-    Args:
-        refresh: If True, re-parse log file to update peers
+    Build the /api/bbs/peers response: peers with computed status, most
+    recently seen first. Takes _bbs_peers_lock, so it runs on the log
+    executor rather than the event loop.
     """
-    try:
+    if refresh:
+        events = parse_bbs_events_from_log()
+
+    with _bbs_peers_lock:
         if refresh:
-            events = parse_bbs_events_from_log()
             data = update_bbs_peers_from_events(events)
             save_bbs_peers(data)
         else:
             data = load_bbs_peers()
+        last_updated = data.get('last_updated')
 
-        # Convert peers dict to list with computed status
-        peers_list = []
-        now = datetime.now()
+        # Convert peers dict to list with computed status, decorated with
+        # last_seen as epoch seconds for sorting
+        decorated = []
+        now = time.time()
 
         for key, peer in data.get('peers', {}).items():
-            try:
-                last_seen = datetime.fromisoformat(peer.get('last_seen', ''))
-                minutes_ago = (now - last_seen).total_seconds() / 60
+            if 'last_seen_epoch' not in peer:
+                # Peers saved before last_seen_epoch was recorded
+                peer['last_seen_epoch'] = bbs_timestamp_epoch(peer.get('last_seen'))
+            last_seen_epoch = peer['last_seen_epoch']
 
+            if last_seen_epoch is None:
+                status = 'unknown'
+                minutes_ago = None
+            else:
+                minutes_ago = (now - last_seen_epoch) / 60
                 if minutes_ago < 10:
                     status = 'active'
                 elif minutes_ago < 60:
                     status = 'stale'
                 else:
                     status = 'offline'
-            except (ValueError, TypeError):
-                status = 'unknown'
-                minutes_ago = None
 
-            peers_list.append({
+            entry = {
                 **peer,
                 'key': key,
                 'status': status,
                 'minutes_ago': round(minutes_ago) if minutes_ago else None
-            })
+            }
+            # sync_history is trimmed in place by refreshes, so hand the
+            # response its own copy
+            if 'sync_history' in entry:
+                entry['sync_history'] = list(entry['sync_history'])
+            decorated.append((float('-inf') if last_seen_epoch is None else last_seen_epoch, entry))
 
-        # Sort by last_seen descending
-        peers_list.sort(key=lambda x: x.get('last_seen', ''), reverse=True)
+    # Sort by last_seen descending
+    decorated.sort(key=itemgetter(0), reverse=True)
+    peers_list = [entry for _, entry in decorated]
 
-        return {
-            "peers": peers_list,
-            "total": len(peers_list),
-            "active": sum(1 for p in peers_list if p['status'] == 'active'),
-            "last_updated": data.get('last_updated')
-        }
+    return {
+        "peers": peers_list,
+        "total": len(peers_list),
+        "active": sum(1 for p in peers_list if p['status'] == 'active'),
+        "last_updated": last_updated
+    }
+
+
+@app.get("/api/bbs/peers")
+async def get_bbs_peers(refresh: bool = False):
+    """
+    Get BBS network peer information.
+
+    Args:
+        refresh: If True, re-parse log file to update peers
+    """
+    try:
+        return await run_log_task(list_bbs_peers, refresh)
     except Exception as e:
         return {"peers": [], "total": 0, "error": str(e)}
 
 
 @app.get("/api/bbs/events")
-def get_bbs_events(limit: int = 50):
+async def get_bbs_events(limit: int = 50):
     """Get recent BBS link events from log."""
     try:
-        events = parse_bbs_events_from_log()
-        # Return most recent events first
-        events.reverse()
+        events = await run_log_task(parse_bbs_events_from_log)
+        # Most recent `limit` events first, in one slice instead of reversing
+        # the whole list (same result as events[::-1][:limit] for any limit)
         return {
-            "events": events[:limit],
+            "events": events[:-limit - 1:-1],
             "total": len(events)
         }
     except Exception as e:
@@ -1439,9 +2075,17 @@ def get_bbs_events(limit: int = 50):
 @app.delete("/api/bbs/peers")
 def clear_bbs_peers():
     """Clear BBS peers tracking data."""
+    global _bbs_peers, _bbs_peers_dirty, _bbs_peers_generation
     try:
-        if os.path.exists(BBS_PEERS_PATH):
-            os.remove(BBS_PEERS_PATH)
+        with _bbs_peers_lock:
+            _bbs_peers = {"peers": {}, "last_updated": None}
+            _bbs_peers_dirty = False
+            _bbs_peers_generation += 1
+        # A flush already past its generation check finishes writing first,
+        # then the file is removed
+        with _bbs_peers_file_lock:
+            if os.path.exists(BBS_PEERS_PATH):
+                os.remove(BBS_PEERS_PATH)
         return {"success": True, "message": "BBS peers data cleared"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1456,8 +2100,8 @@ def get_leaderboard():
         if not os.path.exists(LEADERBOARD_EXPORT_PATH):
             return {"leaderboard": {}, "error": "Leaderboard data not yet available"}
 
-        with open(LEADERBOARD_EXPORT_PATH, 'r') as f:
-            data = json.load(f)
+        with open(LEADERBOARD_EXPORT_PATH, 'rb') as f:
+            data = loads_json(f.read())
 
         raw = data.get("leaderboard", {})
 
@@ -1513,8 +2157,7 @@ def get_leaderboard():
 @app.get("/api/interfaces")
 def get_interfaces():
     try:
-        parser = ConfigParser(CONFIG_PATH)
-        parser.read()
+        parser = ConfigParser.shared(CONFIG_PATH)
         interfaces = get_all_interfaces(parser)
         return {"interfaces": interfaces}
     except Exception as e:
@@ -1527,8 +2170,7 @@ def get_interface(num: int):
         raise HTTPException(status_code=400, detail="Interface number must be 1-9")
     
     try:
-        parser = ConfigParser(CONFIG_PATH)
-        parser.read()
+        parser = ConfigParser.shared(CONFIG_PATH)
         section = get_interface_section_name(num)
         
         if section not in parser.sections:
@@ -1545,39 +2187,40 @@ def get_interface(num: int):
 @app.post("/api/interfaces")
 def add_interface(config: InterfaceUpdate):
     try:
-        parser = ConfigParser(CONFIG_PATH)
-        parser.read()
-        
-        next_num = None
-        for i in range(2, 10):
-            section = get_interface_section_name(i)
-            if section not in parser.sections:
-                next_num = i
-                break
-        
-        if next_num is None:
-            raise HTTPException(status_code=400, detail="Maximum 9 interfaces supported")
-        
-        backup_path = create_backup()
-        
-        section = get_interface_section_name(next_num)
-        parser.add_section(section)
-        
-        for key, field_info in INTERFACE_FIELDS.items():
-            value = getattr(config, key, None)
-            if value is not None:
-                parser.set(section, key, format_value(value, field_info['type']))
-            else:
-                parser.set(section, key, format_value(field_info['default'], field_info['type']))
-        
-        parser.write()
-        
-        return {
-            "success": True,
-            "interface": next_num,
-            "section": section,
-            "backup": backup_path
-        }
+        with _config_write_lock:
+            parser = ConfigParser(CONFIG_PATH)
+            parser.read()
+
+            next_num = None
+            for i in range(2, 10):
+                section = get_interface_section_name(i)
+                if section not in parser.sections:
+                    next_num = i
+                    break
+
+            if next_num is None:
+                raise HTTPException(status_code=400, detail="Maximum 9 interfaces supported")
+
+            backup_path = maybe_backup()
+
+            section = get_interface_section_name(next_num)
+            parser.add_section(section)
+
+            for key, field_info in INTERFACE_FIELDS.items():
+                value = getattr(config, key, None)
+                if value is not None:
+                    parser.set(section, key, format_value(value, field_info['type']))
+                else:
+                    parser.set(section, key, format_value(field_info['default'], field_info['type']))
+
+            parser.write()
+
+            return {
+                "success": True,
+                "interface": next_num,
+                "section": section,
+                "backup": backup_path
+            }
     except HTTPException:
         raise
     except Exception as e:
@@ -1590,28 +2233,29 @@ def update_interface(num: int, config: InterfaceUpdate):
         raise HTTPException(status_code=400, detail="Interface number must be 1-9")
     
     try:
-        parser = ConfigParser(CONFIG_PATH)
-        parser.read()
-        section = get_interface_section_name(num)
-        
-        if section not in parser.sections:
-            raise HTTPException(status_code=404, detail=f"Interface {num} not configured")
-        
-        backup_path = create_backup()
-        
-        fields = PRIMARY_INTERFACE_FIELDS if num == 1 else INTERFACE_FIELDS
-        for key, field_info in fields.items():
-            value = getattr(config, key, None)
-            if value is not None:
-                parser.set(section, key, format_value(value, field_info['type']))
-        
-        parser.write()
-        
-        return {
-            "success": True,
-            "interface": num,
-            "backup": backup_path
-        }
+        with _config_write_lock:
+            parser = ConfigParser(CONFIG_PATH)
+            parser.read()
+            section = get_interface_section_name(num)
+
+            if section not in parser.sections:
+                raise HTTPException(status_code=404, detail=f"Interface {num} not configured")
+
+            backup_path = maybe_backup()
+
+            fields = PRIMARY_INTERFACE_FIELDS if num == 1 else INTERFACE_FIELDS
+            for key, field_info in fields.items():
+                value = getattr(config, key, None)
+                if value is not None:
+                    parser.set(section, key, format_value(value, field_info['type']))
+
+            parser.write()
+
+            return {
+                "success": True,
+                "interface": num,
+                "backup": backup_path
+            }
     except HTTPException:
         raise
     except Exception as e:
@@ -1626,23 +2270,24 @@ def delete_interface(num: int):
         raise HTTPException(status_code=400, detail="Interface number must be 2-9")
     
     try:
-        parser = ConfigParser(CONFIG_PATH)
-        parser.read()
-        section = get_interface_section_name(num)
-        
-        if section not in parser.sections:
-            raise HTTPException(status_code=404, detail=f"Interface {num} not configured")
-        
-        backup_path = create_backup()
-        
-        parser.remove_section(section)
-        parser.write()
-        
-        return {
-            "success": True,
-            "deleted": num,
-            "backup": backup_path
-        }
+        with _config_write_lock:
+            parser = ConfigParser(CONFIG_PATH)
+            parser.read()
+            section = get_interface_section_name(num)
+
+            if section not in parser.sections:
+                raise HTTPException(status_code=404, detail=f"Interface {num} not configured")
+
+            backup_path = maybe_backup()
+
+            parser.remove_section(section)
+            parser.write()
+
+            return {
+                "success": True,
+                "deleted": num,
+                "backup": backup_path
+            }
     except HTTPException:
         raise
     except Exception as e:
@@ -1654,18 +2299,16 @@ def delete_interface(num: int):
 @app.get("/api/config")
 def get_config():
     try:
-        parser = ConfigParser(CONFIG_PATH)
-        raw_config = parser.read()
+        raw_config = ConfigParser.shared(CONFIG_PATH).sections
 
         config = {}
         for section, fields in raw_config.items():
             config[section] = {}
-            schema_section = CONFIG_SCHEMA.get(section, {}).get('fields', {})
+            field_types = _SECTION_FIELD_TYPES.get(section, {})
+            parsers = _VALUE_PARSERS
 
             for key, value in fields.items():
-                field_schema = schema_section.get(key, {})
-                field_type = field_schema.get('type', 'string')
-                config[section][key] = parse_value(value, field_type)
+                config[section][key] = parsers.get(field_types.get(key), _parse_string)(value)
 
         return {"config": config, "path": CONFIG_PATH}
     except FileNotFoundError:
@@ -1686,26 +2329,73 @@ def backup_config():
 @app.get("/api/config/backups")
 def list_backups():
     try:
-        if not os.path.exists(BACKUP_DIR):
+        try:
+            with os.scandir(BACKUP_DIR) as it:
+                entries = [e for e in it if e.name.startswith("config-") and e.name.endswith(".ini")]
+        except FileNotFoundError:
             return {"backups": []}
+        entries.sort(key=lambda e: e.name, reverse=True)
 
         backups = []
-        for f in sorted(os.listdir(BACKUP_DIR), reverse=True):
-            if f.startswith("config-") and f.endswith(".ini"):
-                path = os.path.join(BACKUP_DIR, f)
-                stat = os.stat(path)
-                backups.append({
-                    "filename": f,
-                    "path": path,
-                    "size": stat.st_size,
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                })
+        for entry in entries:
+            stat = entry.stat()
+            backups.append({
+                "filename": entry.name,
+                "path": entry.path,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
 
         return {"backups": backups}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_BOOLEAN_STRINGS = frozenset(('true', 'false', '1', '0', 'yes', 'no'))
+
+
+def _validate_integer(value: Any, field_schema: Dict) -> Optional[str]:
+    if isinstance(value, int):
+        return None
+    try:
+        int(value)
+    except (ValueError, TypeError):
+        return f"Expected integer, got {type(value).__name__}"
+    return None
+
+
+def _validate_float(value: Any, field_schema: Dict) -> Optional[str]:
+    if isinstance(value, (int, float)):
+        return None
+    try:
+        float(value)
+    except (ValueError, TypeError):
+        return f"Expected float, got {type(value).__name__}"
+    return None
+
+
+def _validate_boolean(value: Any, field_schema: Dict) -> Optional[str]:
+    if isinstance(value, bool) or str(value).lower() in _BOOLEAN_STRINGS:
+        return None
+    return f"Expected boolean, got {value}"
+
+
+def _validate_enum(value: Any, field_schema: Dict) -> Optional[str]:
+    options = field_schema.get('options', [])
+    if value in options:
+        return None
+    return f"Value '{value}' not in allowed options: {options}"
+
+
+# field type -> validator returning an error message, or None if the value is valid
+_FIELD_VALIDATORS = {
+    'integer': _validate_integer,
+    'float': _validate_float,
+    'boolean': _validate_boolean,
+    'enum': _validate_enum,
+}
+
+
 @app.post("/api/config/validate")
 def validate_config(config: Dict[str, Dict[str, Any]]):
     errors = []
@@ -1716,36 +2406,17 @@ def validate_config(config: Dict[str, Dict[str, Any]]):
             warnings.append(f"Unknown section: {section}")
             continue
 
-        schema_section = CONFIG_SCHEMA[section].get('fields', {})
-
         for key, value in fields.items():
-            if key not in schema_section:
+            field_schema = _SCHEMA_FIELDS.get((section, key))
+            if field_schema is None:
                 warnings.append(f"Unknown key: {section}.{key}")
                 continue
 
-            field_schema = schema_section[key]
-            field_type = field_schema.get('type', 'string')
-
-            if field_type == 'integer':
-                try:
-                    int(value) if not isinstance(value, int) else value
-                except (ValueError, TypeError):
-                    errors.append(f"{section}.{key}: Expected integer, got {type(value).__name__}")
-
-            elif field_type == 'float':
-                try:
-                    float(value) if not isinstance(value, (int, float)) else value
-                except (ValueError, TypeError):
-                    errors.append(f"{section}.{key}: Expected float, got {type(value).__name__}")
-
-            elif field_type == 'boolean':
-                if not isinstance(value, bool) and str(value).lower() not in ('true', 'false', '1', '0', 'yes', 'no'):
-                    errors.append(f"{section}.{key}: Expected boolean, got {value}")
-
-            elif field_type == 'enum':
-                options = field_schema.get('options', [])
-                if value not in options:
-                    errors.append(f"{section}.{key}: Value '{value}' not in allowed options: {options}")
+            validator = _FIELD_VALIDATORS.get(_SECTION_FIELD_TYPES[section][key])
+            if validator:
+                error = validator(value, field_schema)
+                if error:
+                    errors.append(f"{section}.{key}: {error}")
 
     return {
         "valid": len(errors) == 0,
@@ -1757,15 +2428,17 @@ def validate_config(config: Dict[str, Dict[str, Any]]):
 @app.post("/api/config/restore/{filename}")
 def restore_backup(filename: str):
     try:
-        backup_path = os.path.join(BACKUP_DIR, filename)
-        if not os.path.exists(backup_path):
-            raise HTTPException(status_code=404, detail="Backup not found")
+        with _config_write_lock:
+            backup_path = os.path.join(BACKUP_DIR, filename)
+            if not os.path.exists(backup_path):
+                raise HTTPException(status_code=404, detail="Backup not found")
 
-        create_backup()
+            maybe_backup()
 
-        shutil.copy2(backup_path, CONFIG_PATH)
+            shutil.copy2(backup_path, CONFIG_PATH)
+            ConfigParser._cache.pop(CONFIG_PATH, None)
 
-        return {"success": True, "restored_from": backup_path}
+            return {"success": True, "restored_from": backup_path}
     except HTTPException:
         raise
     except Exception as e:
@@ -1775,19 +2448,17 @@ def restore_backup(filename: str):
 @app.get("/api/config/{section}")
 def get_section(section: str):
     try:
-        parser = ConfigParser(CONFIG_PATH)
-        raw_config = parser.read()
+        raw_config = ConfigParser.shared(CONFIG_PATH).sections
 
         if section not in raw_config:
             raise HTTPException(status_code=404, detail=f"Section '{section}' not found")
 
-        schema_section = CONFIG_SCHEMA.get(section, {}).get('fields', {})
         config = {}
+        field_types = _SECTION_FIELD_TYPES.get(section, {})
+        parsers = _VALUE_PARSERS
 
         for key, value in raw_config[section].items():
-            field_schema = schema_section.get(key, {})
-            field_type = field_schema.get('type', 'string')
-            config[key] = parse_value(value, field_type)
+            config[key] = parsers.get(field_types.get(key), _parse_string)(value)
 
         return {"section": section, "config": config}
     except HTTPException:
@@ -1796,26 +2467,86 @@ def get_section(section: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.put("/api/config/{section}")
-def update_section(section: str, updates: Dict[str, Any]):
-    try:
-        backup_path = create_backup()
+# Section edits are queued to a single writer task, which applies every
+# pending change to one parsed config and writes (and fsyncs) it once
+CONFIG_WRITE_BATCH = 32
+_config_queue: Optional[asyncio.Queue] = None
+config_writer_task = None
+
+
+def format_section_updates(section: str, updates: Dict[str, Any]) -> Dict[str, str]:
+    """Format a section's updates as config strings according to the schema field types"""
+    field_types = _SECTION_FIELD_TYPES.get(section, {})
+    formatters = _VALUE_FORMATTERS
+    return {key: formatters.get(field_types.get(key), str)(value) for key, value in updates.items()}
+
+
+def apply_config_changes(changes: List) -> List[tuple]:
+    """
+    Apply change functions to one parsed config and write it once.
+    Each change is called with the parser; returns ((result, backup path), error) per change.
+    """
+    outcomes = []
+    with _config_write_lock:
+        backup_path = maybe_backup()
 
         parser = ConfigParser(CONFIG_PATH)
         parser.read()
 
-        if section not in parser.sections:
-            raise HTTPException(status_code=404, detail=f"Section '{section}' not found")
+        for change in changes:
+            try:
+                outcomes.append(((change(parser), backup_path), None))
+            except Exception as e:
+                outcomes.append((None, e))
 
-        schema_section = CONFIG_SCHEMA.get(section, {}).get('fields', {})
+        if any(error is None for _, error in outcomes):
+            parser.write()
+    return outcomes
 
-        for key, value in updates.items():
-            field_schema = schema_section.get(key, {})
-            field_type = field_schema.get('type', 'string')
-            formatted_value = format_value(value, field_type)
-            parser.set(section, key, formatted_value)
 
-        parser.write()
+async def config_writer():
+    """Background task draining the config change queue in batches."""
+    while True:
+        batch = [await _config_queue.get()]
+        while len(batch) < CONFIG_WRITE_BATCH and not _config_queue.empty():
+            batch.append(_config_queue.get_nowait())
+
+        try:
+            outcomes = await asyncio.to_thread(apply_config_changes, [change for change, _ in batch])
+        except Exception as e:
+            outcomes = [(None, e)] * len(batch)
+
+        for (_, future), (result, error) in zip(batch, outcomes):
+            if future.done():
+                continue  # request went away while queued
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+async def submit_config_change(change) -> tuple:
+    """Queue change(parser) for the config writer; returns (change's result, backup path)."""
+    global _config_queue, config_writer_task
+    if _config_queue is None:
+        _config_queue = asyncio.Queue()
+    if config_writer_task is None or config_writer_task.done():
+        config_writer_task = asyncio.create_task(config_writer())
+
+    future = asyncio.get_running_loop().create_future()
+    await _config_queue.put((change, future))
+    return await future
+
+
+@app.put("/api/config/{section}")
+async def update_section(section: str, updates: Dict[str, Any]):
+    def change(parser: ConfigParser) -> None:
+        if section not in parser.sections:
+            raise HTTPException(status_code=404, detail=f"Section '{section}' not found")
+        parser.update(section, format_section_updates(section, updates))
+
+    try:
+        _, backup_path = await submit_config_change(change)
 
         return {
             "success": True,
@@ -1830,29 +2561,24 @@ def update_section(section: str, updates: Dict[str, Any]):
 
 
 @app.put("/api/config")
-def update_config(bulk: BulkConfigUpdate):
-    try:
-        backup_path = create_backup()
-
-        parser = ConfigParser(CONFIG_PATH)
-        parser.read()
+async def update_config(bulk: BulkConfigUpdate):
+    def change(parser: ConfigParser) -> List[str]:
+        # Format everything before touching the parser, so a failure leaves
+        # nothing half-applied for the rest of the batch
+        formatted = {
+            section: format_section_updates(section, updates)
+            for section, updates in bulk.updates.items()
+            if section in parser.sections
+        }
 
         updated = []
+        for section, values in formatted.items():
+            parser.update(section, values)
+            updated.extend(f"{section}.{key}" for key in values)
+        return updated
 
-        for section, updates in bulk.updates.items():
-            if section not in parser.sections:
-                continue
-
-            schema_section = CONFIG_SCHEMA.get(section, {}).get('fields', {})
-
-            for key, value in updates.items():
-                field_schema = schema_section.get(key, {})
-                field_type = field_schema.get('type', 'string')
-                formatted_value = format_value(value, field_type)
-                parser.set(section, key, formatted_value)
-                updated.append(f"{section}.{key}")
-
-        parser.write()
+    try:
+        updated, backup_path = await submit_config_change(change)
 
         return {
             "success": True,
@@ -1863,27 +2589,108 @@ def update_config(bulk: BulkConfigUpdate):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/service/status")
-def get_service_status():
-    try:
-        result = subprocess.run(
-            ["docker", "inspect", "-f", "{{.State.Status}}", SERVICE_NAME],
-            capture_output=True,
-            text=True
+async def run_command(*args: str) -> Tuple[int, str, str]:
+    """Run a command without blocking the event loop; returns (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
+
+# Service control commands per backend; SERVICE_NAME is appended
+_SERVICE_STATUS_COMMANDS = {
+    'docker': ("docker", "inspect", "-f", "{{.State.Status}}"),
+    'systemd': ("systemctl", "is-active"),
+}
+_SERVICE_RESTART_COMMANDS = {
+    'docker': ("docker", "restart"),
+    'systemd': ("sudo", "systemctl", "restart"),
+}
+# Docker Engine API socket (mounted into the webgui container by compose.yaml);
+# when present the container is queried over it instead of via the docker CLI
+DOCKER_SOCKET = os.environ.get("DOCKER_SOCKET", "/var/run/docker.sock")
+DOCKER_API_TIMEOUT = 60  # seconds; a restart waits for the container to stop
+# Skip the docker backend on hosts that have neither the socket nor the CLI
+_DOCKER_AVAILABLE = os.path.exists(DOCKER_SOCKET) or shutil.which("docker") is not None
+# Persistent Docker Engine API client, created on first use
+_docker_client: Optional[httpx.AsyncClient] = None
+# Backend that last answered successfully; it is tried first next time
+_service_backend: Optional[str] = None
+
+
+def service_backends() -> Tuple[str, ...]:
+    """Service backends to try, in order."""
+    if not _DOCKER_AVAILABLE:
+        return ('systemd',)
+    if _service_backend == 'systemd':
+        return ('systemd', 'docker')
+    return ('docker', 'systemd')
+
+
+def get_docker_client() -> Optional[httpx.AsyncClient]:
+    """Docker Engine API client over DOCKER_SOCKET, or None if the socket isn't there."""
+    global _docker_client
+    if _docker_client is None and os.path.exists(DOCKER_SOCKET):
+        _docker_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=DOCKER_SOCKET),
+            base_url="http://docker",
+            timeout=DOCKER_API_TIMEOUT
         )
+    return _docker_client
+
+
+async def query_service_status(backend: str) -> Optional[str]:
+    """Status of SERVICE_NAME according to backend, or None if the backend doesn't know it."""
+    client = get_docker_client() if backend == 'docker' else None
+    # An unusable socket or a missing CLI just means this backend doesn't
+    # know, so the caller moves on to the next one
+    if client is not None:
+        try:
+            response = await client.get(f"/containers/{quote(SERVICE_NAME, safe='')}/json")
+        except (httpx.HTTPError, OSError):
+            return None
+        if response.status_code != 200:
+            return None
+        return response.json().get("State", {}).get("Status", "")
+
+    try:
+        returncode, stdout, _ = await run_command(*_SERVICE_STATUS_COMMANDS[backend], SERVICE_NAME)
+    except OSError:
+        return None
+    return stdout.strip() if returncode == 0 else None
+
+
+async def request_service_restart(backend: str) -> Tuple[bool, str]:
+    """Restart SERVICE_NAME through backend; returns (success, error output)."""
+    client = get_docker_client() if backend == 'docker' else None
+    if client is not None:
+        try:
+            response = await client.post(f"/containers/{quote(SERVICE_NAME, safe='')}/restart")
+        except (httpx.HTTPError, OSError) as e:
+            return False, str(e)
+        return response.status_code == 204, response.text
+
+    try:
+        returncode, _, stderr = await run_command(*_SERVICE_RESTART_COMMANDS[backend], SERVICE_NAME)
+    except OSError as e:
+        return False, str(e)
+    return returncode == 0, stderr
 
-        if result.returncode == 0:
-            status = result.stdout.strip()
-        else:
-            result = subprocess.run(
-                ["systemctl", "is-active", SERVICE_NAME],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                status = result.stdout.strip()
-            else:
-                status = "unknown"
+
+@app.get("/api/service/status")
+async def get_service_status():
+    global _service_backend
+    try:
+        status = "unknown"
+        for backend in service_backends():
+            result = await query_service_status(backend)
+            if result is not None:
+                _service_backend = backend
+                status = result
+                break
 
         return {
             "status": status,
@@ -1894,97 +2701,224 @@ def get_service_status():
 
 
 @app.post("/api/service/restart")
-def restart_service():
+async def restart_service():
+    global _service_backend
     try:
-        result = subprocess.run(
-            ["docker", "restart", SERVICE_NAME],
-            capture_output=True,
-            text=True
-        )
+        for backend in service_backends():
+            success, error = await request_service_restart(backend)
+            if success:
+                _service_backend = backend
+                return {"success": True, "message": "Service restart initiated"}
 
-        if result.returncode != 0:
-            result = subprocess.run(
-                ["sudo", "systemctl", "restart", SERVICE_NAME],
-                capture_output=True,
-                text=True
-            )
-
-        if result.returncode == 0:
-            return {"success": True, "message": "Service restart initiated"}
-        else:
-            return {
-                "success": False,
-                "error": result.stderr or "Unknown error"
-            }
+        return {
+            "success": False,
+            "error": error or "Unknown error"
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Seconds browsers may reuse a nodedb response before revalidating it; the bot
+# exports every 30s, so this only absorbs bursts of polls
+NODEDB_MAX_AGE = 2
+
+# Exports at least this big are parsed through mmap instead of read into memory
+NODEDB_MMAP_THRESHOLD = 1024 * 1024
+
+# nodedb "interfaces" keys for interface numbers 1-9
+_NODEDB_INTERFACE_KEYS = tuple(str(num) for num in range(1, 10))
+
+# Seconds a cached nodedb is served without re-checking the file; the bot
+# exports every 30s, so bursts of polls share one stat()
+NODEDB_RECHECK_INTERVAL = 1.0
+
+# Parsed nodedb export keyed by (mtime_ns, size, inode): (key, nodedb, views)
+# where views holds data derived from this export, built on first use
+_nodedb_cache: Optional[tuple] = None
+# time.monotonic() of the last stat() that confirmed _nodedb_cache
+_nodedb_checked_at = 0.0
+
+
 def load_nodedb() -> Dict:
-    """Load node database exported by the bot process."""
+    """
+    Load node database exported by the bot process, reusing the parsed copy
+    while the file is unchanged. The result is shared; don't modify it.
+    """
+    global _nodedb_cache, _nodedb_checked_at
+    cache = _nodedb_cache
+    now = time.monotonic()
+    if cache is not None and now - _nodedb_checked_at < NODEDB_RECHECK_INTERVAL:
+        return cache[1]
+
     try:
-        with open(NODEDB_PATH, "r") as f:
-            return json.load(f)
+        st = os.stat(NODEDB_PATH)
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if cache is not None and cache[0] == key:
+            _nodedb_checked_at = now
+            return cache[1]
+
+        with open(NODEDB_PATH, "rb") as f:
+            # The bot os.replace()s the export, so a mapping can't be truncated under us
+            if st.st_size >= NODEDB_MMAP_THRESHOLD:
+                nodedb = loads_json_mapped(f)
+            else:
+                nodedb = loads_json(f.read())
     except FileNotFoundError:
         return {}
-    except (json.JSONDecodeError, OSError):
+    except (json.JSONDecodeError, OSError, ValueError):
         return {}
 
+    _nodedb_cache = (key, nodedb, {})
+    _nodedb_checked_at = now
+    return nodedb
+
+
+def nodedb_etag(nodedb: Dict) -> Optional[str]:
+    """Weak ETag for a nodedb returned by load_nodedb(), from the stat key it was cached under."""
+    cache = _nodedb_cache
+    if cache is None or cache[1] is not nodedb:
+        return None
+    mtime_ns, size, inode = cache[0]
+    return f'W/"{mtime_ns:x}-{size:x}-{inode:x}"'
+
+
+def nodedb_headers(etag: Optional[str]) -> Dict[str, str]:
+    """Caching headers for nodedb responses: a short private max-age plus the export's ETag."""
+    headers = {"Cache-Control": f"private, max-age={NODEDB_MAX_AGE}"}
+    if etag:
+        headers["ETag"] = etag
+    return headers
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """True if the request's If-None-Match already names etag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return False
+    tags = {tag.strip().removeprefix('W/') for tag in header.split(',')}
+    return '*' in tags or etag.removeprefix('W/') in tags
+
+
+def nodedb_view(nodedb: Dict, name: str, build) -> Any:
+    """
+    Data derived from a nodedb returned by load_nodedb(), built once per
+    export by build(nodedb) and shared by every request; don't modify it.
+    """
+    cache = _nodedb_cache
+    if cache is None or cache[1] is not nodedb:
+        return build(nodedb)
+    views = cache[2]
+    view = views.get(name)
+    if view is None:
+        view = views[name] = build(nodedb)
+    return view
+
+
+def _sorted_nodes(nodedb: Dict) -> List[Dict]:
+    """Nodes sorted by lastHeard descending"""
+    return sorted(nodedb.get("nodes", []), key=lambda x: x.get('lastHeard') or 0, reverse=True)
+
+
+def _dumps_nodes(nodedb: Dict, nodes_list: List[Dict], page: List[Dict]) -> bytes:
+    """/api/nodes response body for one page of the sorted node list"""
+    return orjson.dumps({
+        "nodes": page,
+        "total": len(nodes_list),
+        "exported_at": nodedb.get("exported_at"),
+    })
+
+
+def _nodes_body(nodedb: Dict) -> bytes:
+    """Serialized /api/nodes response for the whole node list"""
+    nodes_list = nodedb_view(nodedb, "sorted_nodes", _sorted_nodes)
+    return _dumps_nodes(nodedb, nodes_list, nodes_list)
+
+
+def _node_info_body(nodedb: Dict) -> bytes:
+    """Serialized /api/nodeinfo response"""
+    return orjson.dumps({"nodeInfo": _node_info_by_interface(nodedb)}, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _node_info_by_interface(nodedb: Dict) -> Dict[int, Dict]:
+    """/api/nodeinfo results keyed by interface number"""
+    return {
+        int(iface_key): {
+            "success": True,
+            "nodeInfo": iface_data.get("myNodeInfo", {}),
+            "channels": iface_data.get("channels", []),
+        }
+        for iface_key, iface_data in nodedb.get("interfaces", {}).items()
+    }
+
 
 @app.get("/api/interfaces/{num}/nodeinfo")
-def get_interface_node_info(num: int):
+def get_interface_node_info(num: int, request: Request):
     """Get node info for a specific interface from the exported nodedb."""
-    if num < 1 or num > 9:
+    if not 1 <= num <= 9:
         raise HTTPException(status_code=400, detail="Interface number must be 1-9")
 
     nodedb = load_nodedb()
     if not nodedb:
         raise HTTPException(status_code=503, detail="Node database not yet available (bot may still be starting)")
 
-    key = str(num)
-    interfaces = nodedb.get("interfaces", {})
-    if key not in interfaces:
+    iface_data = nodedb.get("interfaces", {}).get(_NODEDB_INTERFACE_KEYS[num - 1])
+    if iface_data is None:
         raise HTTPException(status_code=404, detail=f"Interface {num} not found in node database")
 
-    return {"interface": num, "success": True, "nodeInfo": interfaces[key].get("myNodeInfo", {}), "channels": interfaces[key].get("channels", [])}
+    etag = nodedb_etag(nodedb)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=nodedb_headers(etag))
+
+    return ORJSONResponse(
+        {"interface": num, "success": True, "nodeInfo": iface_data.get("myNodeInfo", {}), "channels": iface_data.get("channels", [])},
+        headers=nodedb_headers(etag)
+    )
 
 
 @app.get("/api/nodeinfo")
-def get_all_node_info():
+def get_all_node_info(request: Request):
     """Get node info from all interfaces via the exported nodedb."""
     nodedb = load_nodedb()
     if not nodedb:
         raise HTTPException(status_code=503, detail="Node database not yet available (bot may still be starting)")
 
-    results = {}
-    for iface_key, iface_data in nodedb.get("interfaces", {}).items():
-        results[int(iface_key)] = {
-            "success": True,
-            "nodeInfo": iface_data.get("myNodeInfo", {}),
-            "channels": iface_data.get("channels", []),
-        }
+    # Pollers that already have this export get a bodiless 304
+    etag = nodedb_etag(nodedb)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=nodedb_headers(etag))
 
-    return {"nodeInfo": results}
+    body = nodedb_view(nodedb, "node_info_body", _node_info_body)
+    return Response(content=body, media_type="application/json", headers=nodedb_headers(etag))
 
 
 @app.get("/api/nodes")
-def get_all_nodes():
-    """Get all mesh nodes from the exported nodedb."""
+def get_all_nodes(request: Request, limit: Optional[int] = Query(None, ge=0), offset: int = Query(0, ge=0)):
+    """
+    Get mesh nodes from the exported nodedb, most recently heard first.
+
+    Args:
+        limit: Maximum number of nodes to return (all when omitted)
+        offset: Number of nodes to skip
+    """
     nodedb = load_nodedb()
     if not nodedb:
         raise HTTPException(status_code=503, detail="Node database not yet available (bot may still be starting)")
 
-    nodes_list = nodedb.get("nodes", [])
-    # Sort by lastHeard descending
-    nodes_list.sort(key=lambda x: x.get('lastHeard') or 0, reverse=True)
+    etag = nodedb_etag(nodedb)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=nodedb_headers(etag))
 
-    return {
-        "nodes": nodes_list,
-        "total": len(nodes_list),
-        "exported_at": nodedb.get("exported_at"),
-    }
+    if limit is None and not offset:
+        body = nodedb_view(nodedb, "nodes_body", _nodes_body)
+    else:
+        nodes_list = nodedb_view(nodedb, "sorted_nodes", _sorted_nodes)
+        body = _dumps_nodes(nodedb, nodes_list, nodes_list[offset:None if limit is None else offset + limit])
+    return Response(content=body, media_type="application/json", headers=nodedb_headers(etag))
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Single worker on purpose: OIDC sessions, the scheduler log and BBS peers
+    # live in this process's memory. uvicorn[standard] brings uvloop and
+    # httptools, which "auto" picks up when they're importable.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
@@ -4,9 +4,11 @@ Generic OpenID Connect client — works with any OIDC provider.
 """
 
 import os
+import time
 import secrets
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
 from authlib.integrations.starlette_client import OAuth
 from starlette.requests import Request
@@ -37,6 +39,11 @@ _serializer = URLSafeTimedSerializer(OIDC_SESSION_SECRET)
 # For single-instance deployment this is fine. Restarts invalidate sessions (users re-login).
 _sessions: Dict[str, Dict] = {}
 
+# Verified-cookie cache (maps signed cookie -> (session_id, signature expiry epoch)).
+# Saves re-running the HMAC check on every request from an active browser.
+_VERIFIED_COOKIE_CACHE_SIZE = 4096
+_verified_cookies: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
 # OAuth client
 oauth = OAuth()
 
@@ -60,17 +67,41 @@ def create_session(user_info: dict) -> str:
     return _serializer.dumps(session_id)
 
 
-def get_session(signed_session_id: str) -> Optional[Dict]:
-    """Validate and return session data, or None if invalid/expired."""
+def _verify_session_id(signed_session_id: str) -> Optional[str]:
+    """Return the session ID from a signed cookie, or None if invalid/expired."""
+    cached = _verified_cookies.get(signed_session_id)
+    if cached is not None:
+        session_id, expires_at = cached
+        if time.time() <= expires_at:
+            _verified_cookies.move_to_end(signed_session_id)
+            return session_id
+        del _verified_cookies[signed_session_id]
+        return None
+
     try:
-        session_id = _serializer.loads(signed_session_id, max_age=OIDC_SESSION_MAX_AGE)
-        return _sessions.get(session_id)
+        session_id, signed_at = _serializer.loads(
+            signed_session_id, max_age=OIDC_SESSION_MAX_AGE, return_timestamp=True
+        )
     except (BadSignature, SignatureExpired):
         return None
 
+    _verified_cookies[signed_session_id] = (session_id, signed_at.timestamp() + OIDC_SESSION_MAX_AGE)
+    if len(_verified_cookies) > _VERIFIED_COOKIE_CACHE_SIZE:
+        _verified_cookies.popitem(last=False)
+    return session_id
+
+
+def get_session(signed_session_id: str) -> Optional[Dict]:
+    """Validate and return session data, or None if invalid/expired."""
+    session_id = _verify_session_id(signed_session_id)
+    if session_id is None:
+        return None
+    return _sessions.get(session_id)
+
 
 def destroy_session(signed_session_id: str) -> None:
     """Remove a session."""
+    _verified_cookies.pop(signed_session_id, None)
     try:
         session_id = _serializer.loads(signed_session_id, max_age=OIDC_SESSION_MAX_AGE)
         _sessions.pop(session_id, None)
@@ -0,0 +1,56 @@
+# test_main.py
+# Unit tests for the webgui file helpers
+import os
+import sys
+
+# Add this directory to sys.path to allow importing main
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stat
+import tempfile
+import unittest
+
+import main
+
+
+class TestAtomicWriteBytes(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "config.ini")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_keeps_private_mode(self):
+        with open(self.path, 'wb') as f:
+            f.write(b"[smtp]\nSMTP_PASSWORD = old\n")
+        os.chmod(self.path, 0o600)
+
+        main.atomic_write_bytes(self.path, b"[smtp]\nSMTP_PASSWORD = new\n", fsync=True)
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b"[smtp]\nSMTP_PASSWORD = new\n")
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_keeps_owner(self):
+        with open(self.path, 'wb') as f:
+            f.write(b"old")
+        before = os.stat(self.path)
+
+        main.atomic_write_bytes(self.path, b"new")
+
+        after = os.stat(self.path)
+        self.assertEqual((after.st_uid, after.st_gid), (before.st_uid, before.st_gid))
+
+    def test_new_file_uses_umask(self):
+        umask = os.umask(0o022)
+        try:
+            main.atomic_write_bytes(self.path, b"new")
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+
+if __name__ == '__main__':
+    unittest.main()